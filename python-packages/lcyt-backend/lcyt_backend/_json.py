@@ -0,0 +1,47 @@
+"""orjson-backed JSON provider for Flask, used when orjson is installed.
+
+orjson is an optional speed-up (``pip install lcyt-backend[fast]``); without
+it the app keeps Flask's stdlib-based default provider.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson.
+
+    Keys are sorted to match Flask's default output, and objects orjson
+    cannot encode natively fall back to Flask's ``default`` hook. Dates and
+    datetimes are passed through to that hook too, so they serialize as
+    HTTP dates (``http_date``) exactly as with the default provider rather
+    than as orjson's RFC 3339 strings.
+    """
+
+    _OPTIONS = 0 if orjson is None else (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def use_orjson(app) -> bool:
+    """Install :class:`OrjsonProvider` on *app* if orjson is available.
+
+    Returns:
+        True if the orjson provider was installed.
+    """
+    if orjson is None:
+        return False
+    app.json = OrjsonProvider(app)
+    return True
@@ -8,13 +8,34 @@ import base64
 import hashlib
 import hmac
 import json
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 
 _HEADER = base64.urlsafe_b64encode(
     json.dumps({"alg": "HS256", "typ": "JWT"}).encode()
 ).rstrip(b"=").decode()
+_HEADER_BYTES = (_HEADER + ".").encode()
+
+_SHA256_BLOCK_SIZE = 64
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+
+# Verified payloads keyed by (token, secret), stored with their expiry so a
+# Bearer token reused across many requests is only verified once.
+_DECODE_CACHE_MAXSIZE = 1024
+# Expired entries are swept once per this many inserts, not on every miss.
+_DECODE_CACHE_PURGE_EVERY = 256
+_decode_cache_inserts = 0
+_decode_cache: "OrderedDict[tuple[str, str | bytes], tuple[float, dict[str, Any]]]" = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
+# HMAC-SHA256 inner/outer hash states per secret. The secret is fixed for the
+# life of the process, so key padding is done once and each signature only
+# copies the prepared states.
+_key_state_cache: dict[str | bytes, tuple[Any, Any]] = {}
 
 
 class DecodeError(Exception):
@@ -29,39 +50,110 @@ class ExpiredSignatureError(DecodeError):
     """Raised when the token has expired."""
 
 
-def _b64url_encode(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
-
-
 def _b64url_decode(s: str) -> bytes:
-    # Add padding
-    padding = 4 - len(s) % 4
-    if padding != 4:
-        s += "=" * padding
-    return base64.urlsafe_b64decode(s)
-
-
-def encode(payload: dict[str, Any], secret: str) -> str:
-    """Sign a payload dict as an HS256 JWT."""
-    payload_b64 = _b64url_encode(json.dumps(payload, separators=(",", ":")).encode())
-    signing_input = f"{_HEADER}.{payload_b64}"
-    sig = hmac.new(
-        secret.encode(), signing_input.encode(), hashlib.sha256
-    ).digest()
-    return f"{signing_input}.{_b64url_encode(sig)}"
-
-
-def decode(token: str, secret: str) -> dict[str, Any]:
-    """Verify and decode an HS256 JWT."""
+    b = s.encode("ascii")
+    # Restore the padding stripped by base64url encoding
+    pad = -len(b) & 3
+    return base64.urlsafe_b64decode(b + b"=" * pad if pad else b)
+
+
+def _prepared_states(secret: str | bytes) -> tuple[Any, Any]:
+    states = _key_state_cache.get(secret)
+    if states is None:
+        key = secret.encode() if isinstance(secret, str) else secret
+        if len(key) > _SHA256_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_SHA256_BLOCK_SIZE, b"\0")
+        inner = hashlib.sha256(key.translate(_TRANS_36))
+        outer = hashlib.sha256(key.translate(_TRANS_5C))
+        states = _key_state_cache[secret] = (inner, outer)
+    return states
+
+
+def _sign(signing_input: bytes, secret: str | bytes) -> bytes:
+    """Compute HMAC-SHA256 of *signing_input* from the prepared key states."""
+    inner_proto, outer_proto = _prepared_states(secret)
+    inner = inner_proto.copy()
+    inner.update(signing_input)
+    outer = outer_proto.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+
+def encode(payload: dict[str, Any], secret: str | bytes) -> str:
+    """Sign a payload dict as an HS256 JWT.
+
+    *secret* may be given as ``str`` or pre-encoded UTF-8 ``bytes``.
+    """
+    payload_bytes = json.dumps(payload, separators=(",", ":")).encode()
+    signing_input = _HEADER_BYTES + base64.urlsafe_b64encode(payload_bytes).rstrip(b"=")
+    sig = _sign(signing_input, secret)
+    return (signing_input + b"." + base64.urlsafe_b64encode(sig).rstrip(b"=")).decode()
+
+
+def decode(token: str, secret: str | bytes) -> dict[str, Any]:
+    """Verify and decode an HS256 JWT.
+
+    *secret* may be given as ``str`` or pre-encoded UTF-8 ``bytes``.
+
+    Successfully verified payloads are cached until their ``exp`` so repeated
+    requests with the same token skip signature verification.
+    """
+    cache_key = (token, secret)
+    now = time.time()
+    with _decode_cache_lock:
+        cached = _decode_cache.get(cache_key)
+        if cached is not None:
+            if cached[0] >= now:
+                _decode_cache.move_to_end(cache_key)
+                return dict(cached[1])
+            del _decode_cache[cache_key]
+
+    payload = _verify(token, secret)
+
+    global _decode_cache_inserts
+    exp = payload.get("exp")
+    with _decode_cache_lock:
+        _decode_cache[cache_key] = (exp if exp is not None else float("inf"), payload)
+        _decode_cache_inserts += 1
+        if _decode_cache_inserts % _DECODE_CACHE_PURGE_EVERY == 0:
+            _purge_expired(now)
+        if len(_decode_cache) > _DECODE_CACHE_MAXSIZE:
+            _decode_cache.popitem(last=False)
+    return dict(payload)
+
+
+def _purge_expired(now: float) -> None:
+    """Drop expired entries. Caller holds the lock."""
+    for key in [k for k, (exp, _) in _decode_cache.items() if exp < now]:
+        del _decode_cache[key]
+
+
+def _verify(token: str, secret: str | bytes) -> dict[str, Any]:
     try:
         header_b64, payload_b64, sig_b64 = token.split(".")
     except ValueError:
         raise DecodeError("Token does not have three segments")
 
-    signing_input = f"{header_b64}.{payload_b64}"
-    expected_sig = hmac.new(
-        secret.encode(), signing_input.encode(), hashlib.sha256
-    ).digest()
+    try:
+        payload = json.loads(_b64url_decode(payload_b64))
+    except Exception:
+        raise DecodeError("Invalid payload encoding")
+
+    # The payload is not authenticated yet, so check its shape before use.
+    if not isinstance(payload, dict):
+        raise DecodeError("Payload is not a JSON object")
+    exp = payload.get("exp")
+    if exp is not None and (isinstance(exp, bool) or not isinstance(exp, (int, float))):
+        raise DecodeError("Invalid exp claim")
+
+    # The payload is unsigned plaintext, so rejecting an expired token before
+    # computing the HMAC leaks nothing and skips the hash for stale tokens.
+    if exp is not None and exp < time.time():
+        raise ExpiredSignatureError("Token has expired")
+
+    signing_input = token[: len(token) - len(sig_b64) - 1].encode()
+    expected_sig = _sign(signing_input, secret)
 
     try:
         provided_sig = _b64url_decode(sig_b64)
@@ -71,14 +163,6 @@ def decode(token: str, secret: str) -> dict[str, Any]:
     if not hmac.compare_digest(expected_sig, provided_sig):
         raise InvalidSignatureError("Signature verification failed")
 
-    try:
-        payload = json.loads(_b64url_decode(payload_b64))
-    except Exception:
-        raise DecodeError("Invalid payload encoding")
-
-    if "exp" in payload and payload["exp"] < time.time():
-        raise ExpiredSignatureError("Token has expired")
-
     return payload
 
 
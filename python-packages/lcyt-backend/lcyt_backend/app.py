@@ -6,14 +6,16 @@ Any client with a valid YouTube stream key can register a session
 via POST /live and send captions via POST /captions.
 """
 
+import json
 import logging
 import math
 import os
 import secrets
 import time
 
-from flask import Flask, jsonify
+from flask import Flask, request
 
+from ._json import use_orjson
 from .routes.live import live_bp
 from .routes.captions import captions_bp
 from .routes.sync import sync_bp
@@ -24,6 +26,16 @@ logger = logging.getLogger(__name__)
 # lcyt-web (or any client) can adapt its UI to the available capabilities.
 FEATURES = ["captions", "sync"]
 
+# How long GET /health reuses its serialized body, in seconds.
+HEALTH_CACHE_TTL = 0.5
+
+# Permissive CORS headers, shared by preflight responses and after_request.
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+}
+
 
 def create_app(testing: bool = False) -> Flask:
     """Flask application factory.
@@ -42,6 +54,7 @@ def create_app(testing: bool = False) -> Flask:
     """
     app = Flask(__name__)
     app.config["TESTING"] = testing
+    use_orjson(app)
 
     # -------------------------------------------------------------------------
     # JWT secret — use env var in production, auto-generate for dev/testing.
@@ -57,6 +70,8 @@ def create_app(testing: bool = False) -> Flask:
                 "JWT_SECRET not set — using auto-generated secret. "
                 "Sessions will be lost on restart. Set JWT_SECRET env var for production."
             )
+    # Encoded once so signing and verification never re-encode the secret.
+    app.config["JWT_SECRET_BYTES"] = app.config["JWT_SECRET"].encode()
 
     # -------------------------------------------------------------------------
     # Sender cache — keyed by session ID
@@ -68,20 +83,13 @@ def create_app(testing: bool = False) -> Flask:
     # -------------------------------------------------------------------------
     @app.after_request
     def add_cors_headers(response):
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, DELETE, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
+        response.headers.update(_CORS_HEADERS)
         return response
 
     @app.before_request
     def handle_preflight():
-        from flask import request
         if request.method == "OPTIONS":
-            return ("", 204, {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET, POST, DELETE, OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type, Authorization",
-            })
+            return ("", 204, _CORS_HEADERS)
 
     # -------------------------------------------------------------------------
     # JSON body limit (64 KB)
@@ -93,7 +101,6 @@ def create_app(testing: bool = False) -> Flask:
     # -------------------------------------------------------------------------
     @app.after_request
     def log_request(response):
-        from flask import request
         logger.info("%s %s %d", request.method, request.path, response.status_code)
         return response
 
@@ -103,17 +110,24 @@ def create_app(testing: bool = False) -> Flask:
     app.config["START_TIME"] = time.monotonic()
 
     # -------------------------------------------------------------------------
-    # Health check — includes features list for client capability detection
+    # Health check — includes features list for client capability detection.
+    # The serialized body is reused for HEALTH_CACHE_TTL seconds since load
+    # balancers poll this endpoint continuously.
     # -------------------------------------------------------------------------
+    health_cache = {"ts": 0.0, "body": b""}
+
     @app.get("/health")
     def health():
-        senders = app.config["SENDERS"]
-        return jsonify({
-            "ok": True,
-            "uptime": math.floor(time.monotonic() - app.config["START_TIME"]),
-            "activeSessions": len(senders),
-            "features": FEATURES,
-        })
+        now = time.monotonic()
+        if now - health_cache["ts"] >= HEALTH_CACHE_TTL or not health_cache["body"]:
+            health_cache["body"] = json.dumps({
+                "ok": True,
+                "uptime": math.floor(now - app.config["START_TIME"]),
+                "activeSessions": len(app.config["SENDERS"]),
+                "features": FEATURES,
+            }).encode()
+            health_cache["ts"] = now
+        return app.response_class(health_cache["body"], mimetype="application/json")
 
     # -------------------------------------------------------------------------
     # Blueprints
@@ -20,7 +20,7 @@ def require_auth(f):
             return jsonify({"error": "Authorization header required"}), 401
 
         token = auth_header[len("Bearer "):]
-        secret = current_app.config["JWT_SECRET"]
+        secret = current_app.config["JWT_SECRET_BYTES"]
 
         try:
             payload = jwt_decode(token, secret)
@@ -0,0 +1,14 @@
+"""Flask blueprints for lcyt-backend, plus response helpers they share."""
+
+from flask import Response
+
+_SESSION_NOT_FOUND_BODY = b'{"error":"Session not found"}\n'
+
+
+def session_not_found() -> Response:
+    """404 response for a valid token whose session no longer exists.
+
+    The body is a pre-encoded constant; a new ``Response`` is still built per
+    call because after_request hooks mutate response headers.
+    """
+    return Response(_SESSION_NOT_FOUND_BODY, status=404, mimetype="application/json")
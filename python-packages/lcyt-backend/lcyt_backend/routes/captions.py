@@ -1,12 +1,29 @@
 """POST /captions — Send captions through the session's sender (Bearer auth)."""
 
 from flask import Blueprint, current_app, g, jsonify, request
+from lcyt.sender import Caption  # type: ignore[import]
 
 from ..middleware.auth import require_auth
+from . import session_not_found
 
 captions_bp = Blueprint("captions", __name__)
 
 
+def _resolve_timestamp(caption: dict, base_ms: float):
+    """Return the caption's ``timestamp``, or its ``time`` as epoch seconds.
+
+    ``time`` is ms since session start; *base_ms* is the session start plus
+    sync offset in epoch ms. The sender accepts epoch seconds as-is, so no
+    datetime is built per caption.
+    """
+    ts = caption.get("timestamp")
+    if ts is None:
+        rel = caption.get("time")
+        if isinstance(rel, (int, float)) and not isinstance(rel, bool):
+            return (base_ms + rel) / 1000
+    return ts
+
+
 @captions_bp.post("/")
 @require_auth
 def send_captions():
@@ -16,13 +33,16 @@ def send_captions():
         {
             "captions": [{"text": "Hello", "timestamp": "..."}]
         }
+
+    Each caption may carry ``time`` (ms since session start) instead of
+    ``timestamp``; it is resolved against the session start and sync offset.
     """
     senders = current_app.config["SENDERS"]
     session_id = g.session["sessionId"]
     entry = senders.get(session_id)
 
     if not entry:
-        return jsonify({"error": "Session not found"}), 404
+        return session_not_found()
 
     body = request.get_json(silent=True) or {}
     captions = body.get("captions")
@@ -31,17 +51,13 @@ def send_captions():
         return jsonify({"error": "captions must be a non-empty array"}), 400
 
     try:
-        from lcyt.sender import Caption  # type: ignore[import]
-
-        sender = entry["sender"]
-
-        resolved = []
-        for caption in captions:
-            text = caption.get("text", "")
-            ts = caption.get("timestamp")
-            resolved.append({"text": text, "timestamp": ts})
+        sender = entry.sender
 
-        caption_objs = [Caption(text=c["text"], timestamp=c["timestamp"]) for c in resolved]
+        base_ms = entry.started_at_ms + entry.sync_offset
+        caption_objs = [
+            Caption(text=c.get("text", ""), timestamp=_resolve_timestamp(c, base_ms))
+            for c in captions
+        ]
 
         if len(caption_objs) == 1:
             result = sender.send(caption_objs[0].text, caption_objs[0].timestamp)
@@ -50,9 +66,13 @@ def send_captions():
 
         if 200 <= result.status_code < 300:
             if len(caption_objs) == 1:
+                ts = caption_objs[0].timestamp
+                if ts is not None and captions[0].get("timestamp") is None:
+                    # Resolved from ``time``: report the string the sender sent.
+                    ts = result.timestamp
                 return jsonify({
                     "sequence": result.sequence,
-                    "timestamp": str(resolved[0]["timestamp"]) if resolved[0]["timestamp"] else None,
+                    "timestamp": str(ts) if ts else None,
                     "statusCode": result.status_code,
                     "serverTimestamp": result.server_timestamp,
                 }), 200
@@ -7,27 +7,31 @@ register a session — there is no API key database or admin management.
 import hashlib
 import logging
 import os
+import sys
 import time
 
 from flask import Blueprint, current_app, g, jsonify, request
 from .._jwt import encode as jwt_encode
 from ..middleware.auth import require_auth
+from . import session_not_found
 from .._compat import import_sender
+from ..store import Session
 
 live_bp = Blueprint("live", __name__)
 _log = logging.getLogger(__name__)
 
 
 def _make_session_id(api_key: str, stream_key: str, domain: str) -> str:
+    # Same derivation as the Node.js backend's makeSessionId (first 16 hex
+    # chars of SHA-256); only the 8 bytes kept are hex-encoded.
     raw = f"{api_key}:{stream_key}:{domain}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    return hashlib.sha256(raw.encode()).digest()[:8].hex()
 
 
 def _sync_sender(sender) -> dict:
-    t0 = time.monotonic()
+    t0 = time.perf_counter_ns()
     result = sender.heartbeat()
-    t1 = time.monotonic()
-    rtt_ms = int((t1 - t0) * 1000)
+    rtt_ms = (time.perf_counter_ns() - t0) // 1_000_000
     return {
         "sync_offset": rtt_ms // 2,
         "round_trip_time": rtt_ms,
@@ -45,7 +49,7 @@ def register_session():
     YouTube ingestion URL is used.
     """
     senders = current_app.config["SENDERS"]
-    jwt_secret = current_app.config["JWT_SECRET"]
+    jwt_secret = current_app.config["JWT_SECRET_BYTES"]
 
     body = request.get_json(silent=True) or {}
     api_key = body.get("apiKey", "relay")
@@ -63,17 +67,17 @@ def register_session():
     if not stream_key:
         return jsonify({"error": "streamKey is required (top-level or in targets)"}), 400
 
-    session_id = _make_session_id(api_key, stream_key, domain)
+    session_id = _make_session_id(str(api_key), str(stream_key), str(domain))
 
     # Idempotent: return existing session
     if session_id in senders:
         existing = senders[session_id]
         return jsonify({
-            "token": existing["jwt"],
+            "token": existing.jwt,
             "sessionId": session_id,
-            "sequence": existing["sender"].get_sequence(),
-            "syncOffset": existing.get("sync_offset", 0),
-            "startedAt": existing["started_at"],
+            "sequence": existing.sender.get_sequence(),
+            "syncOffset": existing.sync_offset,
+            "startedAt": existing.started_at,
         }), 200
 
     # Create sender
@@ -99,14 +103,16 @@ def register_session():
     token = jwt_encode(payload, jwt_secret)
 
     started_at = time.time()
-    senders[session_id] = {
-        "sender": sender,
-        "jwt": token,
-        "api_key": api_key,
-        "stream_key": stream_key,
-        "sync_offset": sync_offset,
-        "started_at": started_at,
-    }
+    senders[session_id] = Session(
+        sender=sender,
+        jwt=token,
+        api_key=api_key,
+        stream_key=stream_key,
+        # Many sessions share a handful of domains — keep one copy of each.
+        domain=sys.intern(str(domain)),
+        started_at=started_at,
+        sync_offset=sync_offset,
+    )
 
     return jsonify({
         "token": token,
@@ -125,11 +131,11 @@ def session_status():
     session_id = g.session["sessionId"]
     entry = senders.get(session_id)
     if not entry:
-        return jsonify({"error": "Session not found"}), 404
+        return session_not_found()
 
     return jsonify({
-        "sequence": entry["sender"].get_sequence(),
-        "syncOffset": entry.get("sync_offset", 0),
+        "sequence": entry.sender.get_sequence(),
+        "syncOffset": entry.sync_offset,
     }), 200
 
 
@@ -141,10 +147,10 @@ def remove_session():
     session_id = g.session["sessionId"]
     entry = senders.pop(session_id, None)
     if not entry:
-        return jsonify({"error": "Session not found"}), 404
+        return session_not_found()
 
     try:
-        entry["sender"].end()
+        entry.sender.end()
     except Exception:
         _log.warning("Sender cleanup failed", exc_info=True)
 
@@ -1,13 +1,18 @@
 """POST /sync — NTP-style clock sync for the session's sender (Bearer auth)."""
 
+import json
 import time
 
-from flask import Blueprint, current_app, g, jsonify
+from flask import Blueprint, Response, current_app, g, jsonify
 
 from ..middleware.auth import require_auth
+from . import session_not_found
 
 sync_bp = Blueprint("sync", __name__)
 
+# Fixed-schema success body, filled in with %-formatting instead of jsonify.
+_SYNC_BODY = b'{"syncOffset":%d,"roundTripTime":%d,"serverTimestamp":%s,"statusCode":%d}'
+
 
 @sync_bp.post("/")
 @require_auth
@@ -18,25 +23,24 @@ def sync_session():
     entry = senders.get(session_id)
 
     if not entry:
-        return jsonify({"error": "Session not found"}), 404
+        return session_not_found()
 
     try:
-        sender = entry["sender"]
-        t0 = time.monotonic()
+        sender = entry.sender
+        t0 = time.perf_counter_ns()
         result = sender.heartbeat()
-        t1 = time.monotonic()
-
-        rtt_ms = int((t1 - t0) * 1000)
+        rtt_ms = (time.perf_counter_ns() - t0) // 1_000_000
         sync_offset = rtt_ms // 2
 
-        entry["sync_offset"] = sync_offset
+        entry.sync_offset = sync_offset
 
-        return jsonify({
-            "syncOffset": sync_offset,
-            "roundTripTime": rtt_ms,
-            "serverTimestamp": result.server_timestamp,
-            "statusCode": result.status_code,
-        }), 200
+        body = _SYNC_BODY % (
+            sync_offset,
+            rtt_ms,
+            json.dumps(result.server_timestamp).encode(),
+            result.status_code,
+        )
+        return Response(body, status=200, mimetype="application/json")
 
     except Exception as exc:
         return jsonify({
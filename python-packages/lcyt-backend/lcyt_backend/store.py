@@ -0,0 +1,33 @@
+"""In-memory session records for lcyt-backend."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class Session:
+    """A registered caption session, stored in ``app.config["SENDERS"]``.
+
+    Attributes:
+        sender: The session's ``YoutubeLiveCaptionSender``.
+        jwt: The Bearer token issued for this session.
+        api_key: API key supplied at registration (not validated).
+        stream_key: YouTube stream key.
+        domain: Domain supplied at registration.
+        started_at: Registration time as Unix epoch seconds.
+        sync_offset: Clock offset in ms from the last sync.
+        started_at_ms: ``started_at`` in epoch ms, precomputed for caption
+            timestamp resolution.
+    """
+
+    sender: Any
+    jwt: str
+    api_key: str
+    stream_key: str
+    domain: str
+    started_at: float
+    sync_offset: int = 0
+    started_at_ms: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.started_at_ms = self.started_at * 1000
@@ -3,8 +3,12 @@
 import os
 import pytest
 
+from lcyt.sender import YoutubeLiveCaptionSender
+
 from lcyt_backend.app import create_app
 
+_TIMESTAMP_FORMATTER = YoutubeLiveCaptionSender()
+
 
 @pytest.fixture
 def app():
@@ -30,6 +34,8 @@ def mock_sender():
     """A mock YoutubeLiveCaptionSender for use in tests."""
 
     class MockSendResult:
+        __slots__ = ("sequence", "status_code", "response", "server_timestamp", "count", "timestamp")
+
         def __init__(self, status_code=200, server_timestamp="2024-01-01T00:00:00.000"):
             self.sequence = 0
             self.status_code = status_code
@@ -39,6 +45,8 @@ def mock_sender():
             self.timestamp = None
 
     class MockSender:
+        __slots__ = ("_sequence", "_started")
+
         def __init__(self, stream_key=None, sequence=0, **kwargs):
             self._sequence = sequence
             self._started = False
@@ -64,6 +72,9 @@ def mock_sender():
         def send(self, text, timestamp=None):
             result = MockSendResult()
             result.sequence = self._sequence
+            if timestamp is not None:
+                # Like the real sender: the formatted timestamp that was sent.
+                result.timestamp = _TIMESTAMP_FORMATTER._format_timestamp(timestamp)
             self._sequence += 1
             return result
 
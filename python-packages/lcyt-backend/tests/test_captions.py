@@ -60,3 +60,31 @@ def test_send_captions_with_absolute_timestamp(client, session_token):
         headers=_auth(session_token),
     )
     assert res.status_code == 200
+
+
+def _pin_session_start(app, started_at_ms, sync_offset=0):
+    (entry,) = app.config["SENDERS"].values()
+    entry.started_at_ms = started_at_ms
+    entry.sync_offset = sync_offset
+
+
+def test_send_caption_with_relative_time(app, client, session_token):
+    _pin_session_start(app, 1767225600000, sync_offset=250)
+    res = client.post(
+        "/captions/",
+        json={"captions": [{"text": "Relative", "time": 1500}]},
+        headers=_auth(session_token),
+    )
+    assert res.status_code == 200
+    assert res.get_json()["timestamp"] == "2026-01-01T00:00:01.750"
+
+
+def test_send_caption_bool_time_not_treated_as_number(app, client, session_token):
+    _pin_session_start(app, 1767225600000)
+    res = client.post(
+        "/captions/",
+        json={"captions": [{"text": "Flag", "time": True}]},
+        headers=_auth(session_token),
+    )
+    assert res.status_code == 200
+    assert res.get_json()["timestamp"] is None
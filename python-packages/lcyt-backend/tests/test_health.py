@@ -1,5 +1,9 @@
 """Tests for GET /health."""
 
+from datetime import date, datetime, timezone
+
+from flask.json.provider import DefaultJSONProvider
+
 
 def test_health_returns_200(client):
     res = client.get("/health")
@@ -25,3 +29,30 @@ def test_health_features_list(client):
 def test_health_no_auth_required(client):
     res = client.get("/health")
     assert res.status_code == 200
+
+
+def test_cors_headers_on_response(client):
+    res = client.get("/health")
+    assert res.headers["Access-Control-Allow-Origin"] == "*"
+    assert "POST" in res.headers["Access-Control-Allow-Methods"]
+
+
+def test_preflight_returns_204(client):
+    res = client.options("/captions/")
+    assert res.status_code == 204
+    assert res.headers["Access-Control-Allow-Headers"] == "Content-Type, Authorization"
+
+
+def test_json_provider_roundtrip(app):
+    assert app.json.loads(app.json.dumps({"b": 1, "a": [1, 2]})) == {"a": [1, 2], "b": 1}
+
+
+def test_json_provider_dates_match_flask_default(app):
+    obj = {
+        "at": datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+        "naive": datetime(2026, 1, 1, 12, 30),
+        "day": date(2026, 1, 1),
+    }
+    expected = DefaultJSONProvider(app).loads(DefaultJSONProvider(app).dumps(obj))
+    assert app.json.loads(app.json.dumps(obj)) == expected
+    assert expected["at"] == "Thu, 01 Jan 2026 12:30:00 GMT"
@@ -0,0 +1,83 @@
+"""Tests for the stdlib HS256 JWT helpers."""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+
+from lcyt_backend import _jwt
+
+
+def test_roundtrip():
+    token = _jwt.encode({"sessionId": "abc", "exp": int(time.time()) + 60}, "secret")
+    assert _jwt.decode(token, "secret")["sessionId"] == "abc"
+
+
+def test_wrong_secret_rejected_after_cache_hit():
+    token = _jwt.encode({"sessionId": "abc"}, "secret")
+    _jwt.decode(token, "secret")
+    with pytest.raises(_jwt.InvalidSignatureError):
+        _jwt.decode(token, "other-secret")
+
+
+def test_expired_token_rejected():
+    token = _jwt.encode({"sessionId": "abc", "exp": int(time.time()) - 1}, "secret")
+    with pytest.raises(_jwt.ExpiredSignatureError):
+        _jwt.decode(token, "secret")
+
+
+def test_cached_payload_not_shared():
+    token = _jwt.encode({"sessionId": "abc"}, "secret")
+    _jwt.decode(token, "secret")["sessionId"] = "mutated"
+    assert _jwt.decode(token, "secret")["sessionId"] == "abc"
+
+
+def test_tampered_token_rejected():
+    token = _jwt.encode({"sessionId": "abc"}, "secret")
+    header, payload, sig = token.split(".")
+    with pytest.raises(_jwt.DecodeError):
+        _jwt.decode(f"{header}.{payload}x.{sig}", "secret")
+
+
+@pytest.mark.parametrize("payload", [123, {"exp": "soon"}, {"exp": True}])
+def test_malformed_payload_rejected(payload):
+    payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+    token = f"{_jwt._HEADER}.{payload_b64}.c2ln"
+    with pytest.raises(_jwt.DecodeError):
+        _jwt.decode(token, "secret")
+
+
+@pytest.mark.parametrize("secret", ["s", "x" * 64, "y" * 100])
+def test_signature_matches_stdlib_hmac(secret):
+    data = b"header.payload"
+    assert _jwt._sign(data, secret) == hmac.new(secret.encode(), data, hashlib.sha256).digest()
+
+
+def test_bytes_and_str_secret_interchangeable():
+    token = _jwt.encode({"sessionId": "abc"}, b"secret")
+    assert _jwt.decode(token, "secret")["sessionId"] == "abc"
+
+
+def test_full_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(_jwt, "_DECODE_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(_jwt, "_decode_cache", _jwt.OrderedDict())
+    tokens = [_jwt.encode({"n": i}, "secret") for i in range(3)]
+    _jwt.decode(tokens[0], "secret")
+    _jwt.decode(tokens[1], "secret")
+    _jwt.decode(tokens[0], "secret")  # cache hit: tokens[1] is now the LRU entry
+    _jwt.decode(tokens[2], "secret")
+    assert [key[0] for key in _jwt._decode_cache] == [tokens[0], tokens[2]]
+
+
+def test_expired_entries_swept_periodically(monkeypatch):
+    monkeypatch.setattr(_jwt, "_DECODE_CACHE_PURGE_EVERY", 2)
+    monkeypatch.setattr(_jwt, "_decode_cache", _jwt.OrderedDict())
+    monkeypatch.setattr(_jwt, "_decode_cache_inserts", 0)
+    stale = _jwt.encode({"exp": int(time.time()) + 1}, "secret")
+    _jwt.decode(stale, "secret")
+    monkeypatch.setattr(_jwt.time, "time", lambda: 10**12)
+    _jwt.decode(_jwt.encode({"n": 1}, "secret"), "secret")
+    assert (stale, "secret") not in _jwt._decode_cache
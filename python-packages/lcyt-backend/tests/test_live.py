@@ -84,3 +84,4 @@ def test_delete_then_get_returns_404(client, session_token):
     client.delete("/live/", headers={"Authorization": f"Bearer {session_token}"})
     resp = client.get("/live/", headers={"Authorization": f"Bearer {session_token}"})
     assert resp.status_code == 404
+    assert resp.get_json() == {"error": "Session not found"}
@@ -1,5 +1,10 @@
 """Tests for POST /sync."""
 
+from collections import namedtuple
+
+# Constructing one from the response body checks the exact key set at once.
+SyncResponse = namedtuple("SyncResponse", "syncOffset roundTripTime serverTimestamp statusCode")
+
 
 def _auth(token):
     return {"Authorization": f"Bearer {token}"}
@@ -12,14 +17,18 @@ def test_sync_returns_200(client, session_token):
 
 def test_sync_response_fields(client, session_token):
     res = client.post("/sync/", headers=_auth(session_token))
-    data = res.get_json()
-    assert isinstance(data["syncOffset"], int)
-    assert isinstance(data["roundTripTime"], int)
-    assert data["roundTripTime"] >= 0
-    assert "serverTimestamp" in data
-    assert "statusCode" in data
+    data = SyncResponse(**res.get_json())
+    assert isinstance(data.syncOffset, int)
+    assert isinstance(data.roundTripTime, int)
+    assert data.roundTripTime >= 0
 
 
 def test_sync_no_auth(client):
     res = client.post("/sync/")
     assert res.status_code == 401
+
+
+def test_sync_server_timestamp_passthrough(client, session_token):
+    data = SyncResponse(**client.post("/sync/", headers=_auth(session_token)).get_json())
+    assert data.serverTimestamp == "2024-01-01T00:00:00.000"
+    assert data.statusCode == 200
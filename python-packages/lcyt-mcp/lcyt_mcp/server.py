@@ -1,9 +1,11 @@
 """MCP server for lcyt — sends live captions to YouTube Live streams."""
 
 import asyncio
+import concurrent.futures
+import functools
 import json
 import os
-import secrets
+import re
 from datetime import datetime, timezone
 from typing import Any
 
@@ -48,8 +50,9 @@ async def _backend_post(path: str, headers: dict, body: dict | None = None) -> s
 
 # ── Tool definitions ─────────────────────────────────────────────────────────
 
-TOOLS: list[types.Tool] = [
-    types.Tool(
+# Plain specs; the pydantic ``types.Tool`` models are only built on first use.
+_TOOL_SPECS: tuple[dict, ...] = (
+    dict(
         name="start",
         description="Create a caption sender and start a session. Returns a session_id.",
         inputSchema={
@@ -63,7 +66,7 @@ TOOLS: list[types.Tool] = [
             "required": ["stream_key"],
         },
     ),
-    types.Tool(
+    dict(
         name="send_caption",
         description="Send a single caption to the live stream.",
         inputSchema={
@@ -79,7 +82,7 @@ TOOLS: list[types.Tool] = [
             "required": ["session_id", "text"],
         },
     ),
-    types.Tool(
+    dict(
         name="send_batch",
         description="Send multiple captions atomically.",
         inputSchema={
@@ -102,7 +105,7 @@ TOOLS: list[types.Tool] = [
             "required": ["session_id", "captions"],
         },
     ),
-    types.Tool(
+    dict(
         name="sync_clock",
         description=(
             "NTP-style round-trip to YouTube to compute clock sync offset. "
@@ -114,7 +117,7 @@ TOOLS: list[types.Tool] = [
             "required": ["session_id"],
         },
     ),
-    types.Tool(
+    dict(
         name="get_status",
         description="Return current sequence number and sync offset for the session.",
         inputSchema={
@@ -123,7 +126,7 @@ TOOLS: list[types.Tool] = [
             "required": ["session_id"],
         },
     ),
-    types.Tool(
+    dict(
         name="stop",
         description="End the session and clean up the sender.",
         inputSchema={
@@ -134,12 +137,12 @@ TOOLS: list[types.Tool] = [
     ),
 
     # ── Production tools ──────────────────────────────────────────────────────
-    types.Tool(
+    dict(
         name="list_cameras",
         description="List all cameras with their id, name, mixerInput, controlType, and controlConfig.",
         inputSchema={"type": "object", "properties": {}},
     ),
-    types.Tool(
+    dict(
         name="camera_preset",
         description="Trigger a PTZ preset on a camera. Returns { ok, cameraId, presetId }.",
         inputSchema={
@@ -151,12 +154,12 @@ TOOLS: list[types.Tool] = [
             "required": ["camera_id", "preset_id"],
         },
     ),
-    types.Tool(
+    dict(
         name="list_mixers",
         description="List all mixers with id, name, type, connected, and activeSource.",
         inputSchema={"type": "object", "properties": {}},
     ),
-    types.Tool(
+    dict(
         name="switch_source",
         description="Switch the mixer's live program source. Returns { ok, mixerId, activeSource }.",
         inputSchema={
@@ -170,12 +173,12 @@ TOOLS: list[types.Tool] = [
     ),
 
     # ── Graphics / DSK tools ──────────────────────────────────────────────────
-    types.Tool(
+    dict(
         name="list_dsk_templates",
         description="List all saved DSK overlay templates for the API key. Returns [{ id, name, updated_at }].",
         inputSchema={"type": "object", "properties": {}},
     ),
-    types.Tool(
+    dict(
         name="activate_dsk_template",
         description="Load a DSK template into the Playwright renderer. Returns { ok, id, name }.",
         inputSchema={
@@ -186,7 +189,7 @@ TOOLS: list[types.Tool] = [
             "required": ["template_id"],
         },
     ),
-    types.Tool(
+    dict(
         name="broadcast_dsk_data",
         description="Inject live text into the renderer DOM without page reload. Accepts an array of {selector, text} objects.",
         inputSchema={
@@ -208,25 +211,63 @@ TOOLS: list[types.Tool] = [
             "required": ["updates"],
         },
     ),
-    types.Tool(
+    dict(
         name="dsk_renderer_status",
         description="Get DSK renderer running state for the API key. Returns { running, rtmpUrl? }.",
         inputSchema={"type": "object", "properties": {}},
     ),
-    types.Tool(
+    dict(
         name="start_dsk_renderer",
         description="Start DSK Playwright capture loop → ffmpeg → nginx-rtmp. Returns { ok, rtmpUrl }.",
         inputSchema={"type": "object", "properties": {}},
     ),
-    types.Tool(
+    dict(
         name="stop_dsk_renderer",
         description="Stop DSK capture loop and ffmpeg. Returns { ok }.",
         inputSchema={"type": "object", "properties": {}},
     ),
-]
+)
+
+TOOL_NAMES: frozenset[str] = frozenset(spec["name"] for spec in _TOOL_SPECS)
+
+
+@functools.cache
+def get_tools() -> tuple[types.Tool, ...]:
+    """Return the tool definitions, validating them once on first call."""
+    return tuple(types.Tool(**spec) for spec in _TOOL_SPECS)
+
+
+def __getattr__(name: str) -> Any:
+    # ``TOOLS`` (the former list of tool models) stays importable, built lazily.
+    if name == "TOOLS":
+        return list(get_tools())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ── Resources ────────────────────────────────────────────────────────────────
+
+_RESOURCE_PREFIX = "session://"
+
+# Session ids are 16 lowercase hex chars; anything else is rejected outright.
+_RESOURCE_URI_RE = re.compile(r"session://([0-9a-f]{16})")
 
 # ── Handler factory (exported for testing with a fake sender) ────────────────
 
+# Sender calls block on HTTP. Run them on one process-wide pool instead of
+# asyncio.to_thread, which also copies the contextvars context per call.
+# Workers start lazily and are shared by every create_handlers() result.
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="lcyt-send"
+)
+
+
+@functools.cache
+def _default_sender_class():
+    """Import ``YoutubeLiveCaptionSender`` on first use and remember it."""
+    from lcyt import YoutubeLiveCaptionSender  # lazy import
+
+    return YoutubeLiveCaptionSender
+
 
 def create_handlers(SenderClass=None):
     """
@@ -237,13 +278,14 @@ def create_handlers(SenderClass=None):
     lazily so ``lcyt`` is not required when testing with a fake).
     """
     if SenderClass is None:
-        from lcyt import YoutubeLiveCaptionSender  # lazy import
-
-        SenderClass = YoutubeLiveCaptionSender
+        SenderClass = _default_sender_class()
 
     sessions: dict[str, Any] = {}
     session_meta: dict[str, dict] = {}
 
+    async def _run(fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
     def _get_session(session_id: str):
         sender = sessions.get(session_id)
         if sender is None:
@@ -251,24 +293,30 @@ def create_handlers(SenderClass=None):
         return sender
 
     async def list_tools() -> list[types.Tool]:
-        return TOOLS
+        return list(get_tools())
+
+    # Resource list, rebuilt only after a session is started or stopped.
+    resources_snapshot: tuple[types.Resource, ...] | None = None
 
     async def list_resources() -> list[types.Resource]:
-        return [
-            types.Resource(
-                uri=f"session://{sid}",
-                name=f"Session {sid}",
-                description="JSON snapshot of the caption session state.",
-                mimeType="application/json",
+        nonlocal resources_snapshot
+        if resources_snapshot is None:
+            resources_snapshot = tuple(
+                types.Resource(
+                    uri=f"{_RESOURCE_PREFIX}{sid}",
+                    name=f"Session {sid}",
+                    description="JSON snapshot of the caption session state.",
+                    mimeType="application/json",
+                )
+                for sid in sessions
             )
-            for sid in sessions
-        ]
+        return list(resources_snapshot)
 
     async def read_resource(uri: str) -> str:
-        prefix = "session://"
-        if not uri.startswith(prefix):
+        match = _RESOURCE_URI_RE.fullmatch(uri)
+        if match is None:
             raise ValueError(f"Unknown resource URI: {uri!r}")
-        session_id = uri[len(prefix):]
+        session_id = match.group(1)
         sender = _get_session(session_id)
         meta = session_meta.get(session_id, {})
         return json.dumps({
@@ -277,134 +325,121 @@ def create_handlers(SenderClass=None):
             "startedAt": meta.get("startedAt"),
         })
 
+    def _text(text: str) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=text)]
+
+    # ── Caption tools ─────────────────────────────────────────────────────
+
+    async def _start(arguments: dict) -> list[types.TextContent]:
+        nonlocal resources_snapshot
+        sender = SenderClass(stream_key=arguments["stream_key"])
+        await _run(sender.start)
+        sid = os.urandom(8).hex()  # 16 hex chars, as _RESOURCE_URI_RE expects
+        sessions[sid] = sender
+        session_meta[sid] = {
+            "startedAt": datetime.now(tz=timezone.utc).isoformat()
+        }
+        resources_snapshot = None
+        return _text(json.dumps({"session_id": sid}))
+
+    async def _send_caption(arguments: dict) -> list[types.TextContent]:
+        sender = _get_session(arguments["session_id"])
+        ts = arguments.get("timestamp")
+        result = await _run(sender.send, arguments["text"], ts)
+        return _text(json.dumps({"ok": True, "sequence": result.sequence}))
+
+    async def _send_batch(arguments: dict) -> list[types.TextContent]:
+        sender = _get_session(arguments["session_id"])
+        result = await _run(sender.send_batch, arguments["captions"])
+        return _text(json.dumps({"ok": True, "sequence": result.sequence, "count": result.count}))
+
+    async def _sync_clock(arguments: dict) -> list[types.TextContent]:
+        sender = _get_session(arguments["session_id"])
+        result = await _run(sender.sync)
+        return _text(json.dumps({"syncOffset": result["sync_offset"]}))
+
+    async def _get_status(arguments: dict) -> list[types.TextContent]:
+        sender = _get_session(arguments["session_id"])
+        return _text(json.dumps({
+            "sequence": sender.get_sequence(),
+            "syncOffset": sender.get_sync_offset(),
+        }))
+
+    async def _stop(arguments: dict) -> list[types.TextContent]:
+        nonlocal resources_snapshot
+        sender = sessions.pop(arguments["session_id"], None)
+        if sender is None:
+            raise ValueError(f"Unknown session_id: {arguments['session_id']!r}")
+        session_meta.pop(arguments["session_id"], None)
+        resources_snapshot = None
+        await _run(sender.end)
+        return _text(json.dumps({"ok": True}))
+
+    # ── Production tools ──────────────────────────────────────────────────
+
+    async def _list_cameras(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_get("/production/cameras", _admin_headers()))
+
+    async def _camera_preset(arguments: dict) -> list[types.TextContent]:
+        cid, pid = arguments["camera_id"], arguments["preset_id"]
+        return _text(await _backend_post(f"/production/cameras/{cid}/preset/{pid}", _admin_headers()))
+
+    async def _list_mixers(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_get("/production/mixers", _admin_headers()))
+
+    async def _switch_source(arguments: dict) -> list[types.TextContent]:
+        mid, inp = arguments["mixer_id"], arguments["input"]
+        return _text(await _backend_post(f"/production/mixers/{mid}/switch/{inp}", _admin_headers()))
+
+    # ── Graphics / DSK tools ──────────────────────────────────────────────
+
+    async def _list_dsk_templates(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_get(f"/dsk/{API_KEY}/templates", _editor_headers()))
+
+    async def _activate_dsk_template(arguments: dict) -> list[types.TextContent]:
+        tid = arguments["template_id"]
+        return _text(await _backend_post(f"/dsk/{API_KEY}/templates/{tid}/activate", _editor_headers()))
+
+    async def _broadcast_dsk_data(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_post(
+            f"/dsk/{API_KEY}/broadcast",
+            _editor_headers(),
+            {"updates": arguments["updates"]},
+        ))
+
+    async def _dsk_renderer_status(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_get(f"/dsk/{API_KEY}/renderer/status", _editor_headers()))
+
+    async def _start_dsk_renderer(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_post(f"/dsk/{API_KEY}/renderer/start", _editor_headers()))
+
+    async def _stop_dsk_renderer(arguments: dict) -> list[types.TextContent]:
+        return _text(await _backend_post(f"/dsk/{API_KEY}/renderer/stop", _editor_headers()))
+
+    dispatch = {
+        "start": _start,
+        "send_caption": _send_caption,
+        "send_batch": _send_batch,
+        "sync_clock": _sync_clock,
+        "get_status": _get_status,
+        "stop": _stop,
+        "list_cameras": _list_cameras,
+        "camera_preset": _camera_preset,
+        "list_mixers": _list_mixers,
+        "switch_source": _switch_source,
+        "list_dsk_templates": _list_dsk_templates,
+        "activate_dsk_template": _activate_dsk_template,
+        "broadcast_dsk_data": _broadcast_dsk_data,
+        "dsk_renderer_status": _dsk_renderer_status,
+        "start_dsk_renderer": _start_dsk_renderer,
+        "stop_dsk_renderer": _stop_dsk_renderer,
+    }
+
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-        match name:
-            case "start":
-                sender = SenderClass(stream_key=arguments["stream_key"])
-                await asyncio.to_thread(sender.start)
-                sid = secrets.token_hex(8)
-                sessions[sid] = sender
-                session_meta[sid] = {
-                    "startedAt": datetime.now(tz=timezone.utc).isoformat()
-                }
-                return [types.TextContent(type="text", text=json.dumps({"session_id": sid}))]
-
-            case "send_caption":
-                sender = _get_session(arguments["session_id"])
-                ts = arguments.get("timestamp")
-                result = await asyncio.to_thread(sender.send, arguments["text"], ts)
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps({"ok": True, "sequence": result.sequence}),
-                )]
-
-            case "send_batch":
-                sender = _get_session(arguments["session_id"])
-                result = await asyncio.to_thread(sender.send_batch, arguments["captions"])
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps({"ok": True, "sequence": result.sequence, "count": result.count}),
-                )]
-
-            case "sync_clock":
-                sender = _get_session(arguments["session_id"])
-                result = await asyncio.to_thread(sender.sync)
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps({"syncOffset": result["sync_offset"]}),
-                )]
-
-            case "get_status":
-                sender = _get_session(arguments["session_id"])
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "sequence": sender.get_sequence(),
-                        "syncOffset": sender.get_sync_offset(),
-                    }),
-                )]
-
-            case "stop":
-                sender = sessions.pop(arguments["session_id"], None)
-                if sender is None:
-                    raise ValueError(f"Unknown session_id: {arguments['session_id']!r}")
-                session_meta.pop(arguments["session_id"], None)
-                await asyncio.to_thread(sender.end)
-                return [types.TextContent(type="text", text=json.dumps({"ok": True}))]
-
-            # ── Production tools ───────────────────────────────────────────
-
-            case "list_cameras":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_get("/production/cameras", _admin_headers()),
-                )]
-
-            case "camera_preset":
-                cid, pid = arguments["camera_id"], arguments["preset_id"]
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(f"/production/cameras/{cid}/preset/{pid}", _admin_headers()),
-                )]
-
-            case "list_mixers":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_get("/production/mixers", _admin_headers()),
-                )]
-
-            case "switch_source":
-                mid, inp = arguments["mixer_id"], arguments["input"]
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(f"/production/mixers/{mid}/switch/{inp}", _admin_headers()),
-                )]
-
-            # ── Graphics / DSK tools ───────────────────────────────────────
-
-            case "list_dsk_templates":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_get(f"/dsk/{API_KEY}/templates", _editor_headers()),
-                )]
-
-            case "activate_dsk_template":
-                tid = arguments["template_id"]
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(f"/dsk/{API_KEY}/templates/{tid}/activate", _editor_headers()),
-                )]
-
-            case "broadcast_dsk_data":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(
-                        f"/dsk/{API_KEY}/broadcast",
-                        _editor_headers(),
-                        {"updates": arguments["updates"]},
-                    ),
-                )]
-
-            case "dsk_renderer_status":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_get(f"/dsk/{API_KEY}/renderer/status", _editor_headers()),
-                )]
-
-            case "start_dsk_renderer":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(f"/dsk/{API_KEY}/renderer/start", _editor_headers()),
-                )]
-
-            case "stop_dsk_renderer":
-                return [types.TextContent(
-                    type="text",
-                    text=await _backend_post(f"/dsk/{API_KEY}/renderer/stop", _editor_headers()),
-                )]
-
-            case _:
-                raise ValueError(f"Unknown tool: {name!r}")
+        handler = dispatch.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name!r}")
+        return await handler(arguments)
 
     return {
         "sessions": sessions,
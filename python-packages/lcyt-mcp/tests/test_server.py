@@ -4,8 +4,10 @@ Uses create_handlers(FakeSender) so no network calls or lcyt install is needed.
 """
 
 import json
+import threading
+
 import pytest
-from lcyt_mcp.server import create_handlers, TOOLS
+from lcyt_mcp.server import create_handlers, get_tools, TOOL_NAMES
 
 
 # ---------------------------------------------------------------------------
@@ -14,6 +16,8 @@ from lcyt_mcp.server import create_handlers, TOOLS
 
 
 class _FakeSendResult:
+    __slots__ = ("sequence", "status_code", "response", "server_timestamp", "count", "timestamp")
+
     def __init__(self, sequence=0, count=None):
         self.sequence = sequence
         self.status_code = 200
@@ -26,6 +30,8 @@ class _FakeSendResult:
 class FakeSender:
     """Stand-in for YoutubeLiveCaptionSender that never touches the network."""
 
+    __slots__ = ("_stream_key", "_sequence", "_sync_offset", "_started")
+
     def __init__(self, *, stream_key=None, **kwargs):
         self._stream_key = stream_key
         self._sequence = 0
@@ -83,8 +89,10 @@ def h():
 
 
 def test_tools_list_has_sixteen_entries():
-    assert len(TOOLS) == 16
-    names = {t.name for t in TOOLS}
+    tools = get_tools()
+    assert len(tools) == 16
+    names = {t.name for t in tools}
+    assert names == TOOL_NAMES
     assert {"start", "send_caption", "send_batch", "sync_clock", "get_status", "stop"}.issubset(names)
     assert {"list_cameras", "camera_preset", "list_mixers", "switch_source"}.issubset(names)
     assert {
@@ -93,10 +101,16 @@ def test_tools_list_has_sixteen_entries():
     }.issubset(names)
 
 
+def test_tools_alias_still_importable():
+    from lcyt_mcp.server import TOOLS
+
+    assert TOOLS == list(get_tools())
+
+
 @pytest.mark.asyncio
 async def test_list_tools_matches_tools_constant(h):
     result = await h["list_tools"]()
-    assert result == TOOLS
+    assert result == list(get_tools())
 
 
 @pytest.mark.asyncio
@@ -107,6 +121,15 @@ async def test_start_creates_session(h):
     assert payload["session_id"] in h["sessions"]
 
 
+@pytest.mark.asyncio
+async def test_handler_sets_share_one_worker_pool():
+    handler_sets = [create_handlers(FakeSender) for _ in range(20)]
+    for hs in handler_sets:
+        await hs["call_tool"]("start", {"stream_key": "k"})
+    workers = [t for t in threading.enumerate() if t.name.startswith("lcyt-send")]
+    assert 1 <= len(workers) <= 8
+
+
 @pytest.mark.asyncio
 async def test_start_stores_metadata(h):
     result = await h["call_tool"]("start", {"stream_key": "test-key"})
@@ -214,6 +237,16 @@ async def test_list_resources_reflects_sessions(h):
     assert f"session://{sid}" in uris
 
 
+@pytest.mark.asyncio
+async def test_list_resources_drops_stopped_session(h):
+    start = await h["call_tool"]("start", {"stream_key": "k"})
+    sid = json.loads(start[0].text)["session_id"]
+    assert len(await h["list_resources"]()) == 1
+
+    await h["call_tool"]("stop", {"session_id": sid})
+    assert await h["list_resources"]() == []
+
+
 @pytest.mark.asyncio
 async def test_read_resource_returns_snapshot(h):
     start = await h["call_tool"]("start", {"stream_key": "k"})
@@ -232,6 +265,18 @@ async def test_read_resource_unknown_uri_raises(h):
         await h["read_resource"]("unknown://foo")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("uri", [
+    "session://",
+    "session://../etc/passwd",
+    "session://0123456789ABCDEF",
+    "session://0123456789abcdef/extra",
+])
+async def test_read_resource_malformed_session_uri_raises(h, uri):
+    with pytest.raises(ValueError, match="Unknown resource URI"):
+        await h["read_resource"](uri)
+
+
 # ---------------------------------------------------------------------------
 # Production and DSK tools — no LCYT_BACKEND_URL configured
 # ---------------------------------------------------------------------------
@@ -12,6 +12,7 @@ Example:
 """
 
 from .sender import YoutubeLiveCaptionSender, Caption, SendResult
+from .async_sender import AsyncYoutubeLiveCaptionSender
 from .backend_sender import BackendCaptionSender
 from .errors import LCYTError, ConfigError, NetworkError, ValidationError
 from .logger import set_use_stderr, set_silent
@@ -28,6 +29,7 @@ __version__ = "1.2.0"
 __all__ = [
     # Main classes
     "YoutubeLiveCaptionSender",
+    "AsyncYoutubeLiveCaptionSender",
     "BackendCaptionSender",
     # Data classes
     "Caption",
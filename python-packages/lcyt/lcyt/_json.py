@@ -0,0 +1,32 @@
+"""JSON helpers that use orjson when it is installed.
+
+lcyt has no runtime dependencies; orjson is only picked up if present.
+``dumps`` always returns compact UTF-8 ``bytes``, ``dumps_indented`` the
+same with two-space indentation, and ``loads`` accepts ``bytes`` or ``str``.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    loads = json.loads
@@ -0,0 +1,207 @@
+"""Asyncio YouTube Live Caption Sender (requires the optional ``aiohttp`` extra)."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from .sender import _TEXT_HEADERS, Caption, SendResult, _CaptionSenderBase, logger
+from .errors import NetworkError, ValidationError
+
+
+class AsyncYoutubeLiveCaptionSender(_CaptionSenderBase):
+    """Send live captions to YouTube streams from asyncio code.
+
+    Same API as ``YoutubeLiveCaptionSender`` except that ``start``, ``end``,
+    ``send``, ``send_batch``, ``heartbeat``, ``sync`` and ``send_test`` are
+    coroutines. All POSTs share one ``aiohttp.ClientSession`` with a
+    keep-alive connection to the ingestion host, so the event loop can keep
+    capturing captions (or drive other streams) while a request is in flight.
+    Concurrent calls on one sender are sent one at a time, in call order, so
+    every POST gets its own sequence number.
+
+    Install with ``pip install "lcyt[async]"``.
+
+    Example:
+        >>> sender = AsyncYoutubeLiveCaptionSender(stream_key="YOUR_KEY")
+        >>> await sender.start()
+        >>> result = await sender.send("Hello, world!")
+        >>> await sender.end()
+    """
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> "AsyncYoutubeLiveCaptionSender":
+        """Initialize the sender and open its HTTP session.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValidationError: If stream_key or ingestion_url is not set.
+            ImportError: If ``aiohttp`` is not installed.
+        """
+        try:
+            import aiohttp
+        except ImportError as exc:
+            raise ImportError(
+                'AsyncYoutubeLiveCaptionSender requires aiohttp: pip install "lcyt[async]"'
+            ) from exc
+
+        self._resolve_url()
+
+        await self.close()
+        # Held from reading the sequence number until the POST completes.
+        self._send_lock = asyncio.Lock()
+        self._conn = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=75, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+        self._started = True
+        logger.debug("Async sender started with URL: %s", self._url)
+        return self
+
+    async def end(self) -> "AsyncYoutubeLiveCaptionSender":
+        """Stop the sender, close its HTTP session and cleanup.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._started = False
+        self._queue.clear()
+        self._encoded.clear()
+        await self.close()
+        logger.debug("Caption sender stopped. Total captions sent: %d", self._sequence)
+        return self
+
+    async def close(self) -> None:
+        """Close the HTTP session, if open."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    async def send(self, text: str, timestamp: str | datetime | int | float | None = None) -> SendResult:
+        """Send a single caption.
+
+        Args:
+            text: Caption text to send.
+            timestamp: Optional timestamp. Accepts the same forms as
+                       ``YoutubeLiveCaptionSender.send()``.
+
+        Returns:
+            SendResult. The ``timestamp`` field is set to the formatted string sent.
+
+        Raises:
+            ValidationError: If sender not started or text is empty.
+            NetworkError: If HTTP request fails.
+        """
+        self._ensure_started()
+        if not text:
+            raise ValidationError("Caption text cannot be empty", field="text")
+
+        ts, body = self._build_single_body(text, timestamp)
+        async with self._send_lock:
+            sent_sequence = self._sequence
+            result = await self._send_post(body, sent_sequence)
+            result = self._finish_batch(result, sent_sequence, 1)
+        if timestamp is not None:
+            result.timestamp = ts
+        return result
+
+    async def send_batch(self, captions: list[Caption] | None = None) -> SendResult:
+        """Send a batch of captions.
+
+        Args:
+            captions: List of captions to send. If None, sends queued captions.
+
+        Returns:
+            SendResult with sequence, count, status code, and response.
+
+        Raises:
+            ValidationError: If sender not started or no captions to send.
+            NetworkError: If HTTP request fails.
+        """
+        captions = self._take_batch(captions)
+        body = self._build_batch_body(captions)
+        async with self._send_lock:
+            sent_sequence = self._sequence
+            result = await self._send_post(body, sent_sequence)
+            return self._finish_batch(result, sent_sequence, len(captions))
+
+    async def heartbeat(self) -> SendResult:
+        """Send a heartbeat (empty POST) to verify connection.
+
+        Returns:
+            SendResult with status code and server timestamp.
+
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
+        """
+        self._ensure_started()
+        async with self._send_lock:
+            return self._finish_heartbeat(await self._send_post(b"", self._sequence))
+
+    async def sync(self) -> dict:
+        """Synchronize the local clock with YouTube's server clock (NTP-style).
+
+        Returns:
+            dict with keys ``sync_offset``, ``round_trip_time``,
+            ``server_timestamp`` and ``status_code``.
+
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
+        """
+        self._ensure_started()
+
+        async with self._send_lock:
+            # Time only the heartbeat itself, not the wait for the lock.
+            t1_wall_ns = time.time_ns()
+            result = self._finish_heartbeat(await self._send_post(b"", self._sequence))
+            t2_wall_ns = time.time_ns()
+        return self._finish_sync(t1_wall_ns, t2_wall_ns, result)
+
+    async def send_test(self) -> SendResult:
+        """Send a test payload using current timestamps.
+
+        Returns:
+            SendResult with status code and response.
+
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
+        """
+        self._ensure_started()
+        async with self._send_lock:
+            sent_sequence = self._sequence
+            result = await self._send_post(self._build_test_body(), sent_sequence)
+            return self._finish_test(result, sent_sequence)
+
+    # ------------------------------------------------------------------
+    # Private implementation
+    # ------------------------------------------------------------------
+
+    async def _send_post(self, body: bytes, sequence: int) -> SendResult:
+        """Send HTTP POST request to YouTube over the shared session."""
+        url = f"{self._post_url_prefix}{sequence}"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("POST %s", url)
+            logger.debug("Body: %r", body)
+
+        try:
+            async with self._conn.post(url, data=body, headers=_TEXT_HEADERS) as r:
+                response_body = (await r.read()).decode("utf-8")
+                status = r.status
+        except Exception as e:
+            raise NetworkError(f"HTTP request failed: {e}") from e
+
+        return self._result_from_response(sequence, status, response_body)
@@ -1,12 +1,112 @@
 """Backend relay caption sender — communicates with lcyt-backend instead of YouTube directly."""
 
+import base64
+import hashlib
+import http.client
 import json
-import urllib.error
-import urllib.request
+import os
+import stat
+import tempfile
+import threading
+import time as _time
+from pathlib import Path
 from typing import Any
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
+from . import _json
 from .errors import NetworkError
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+DEFAULT_JWT_CACHE_FILENAME = ".lcyt_jwt_cache"
+
+# A cached token is only reused while it has at least this long left to live.
+JWT_CACHE_MIN_TTL = 600
+
+
+def _jwt_cache_path() -> Path:
+    """Get the default JWT cache file path (~/.lcyt_jwt_cache)."""
+    return Path.home() / DEFAULT_JWT_CACHE_FILENAME
+
+
+def _proxy_for(scheme: str, host: str) -> str | None:
+    """Return the proxy URL urllib would use for *host*, honouring ``*_PROXY``/``NO_PROXY``."""
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_auth_headers(proxy: str) -> dict:
+    """``Proxy-Authorization`` for credentials embedded in a proxy URL, if any."""
+    parsed = urlsplit(proxy)
+    if parsed.username is None:
+        return {}
+    creds = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode()).decode()}
+
+
+def _jwt_cache_key(backend_url: str, api_key: str, stream_key: str) -> str:
+    """Key a cached session by backend, API key and stream key without storing the secrets."""
+    raw = f"{backend_url}\0{api_key}\0{stream_key}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _token_exp(token: str) -> int | None:
+    """Return the ``exp`` claim of a JWT without verifying it, or None."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return exp if isinstance(exp, (int, float)) else None
+
+
+def _read_jwt_cache(path: Path) -> dict:
+    """Read the JWT cache file, returning ``{}`` if it is missing, unsafe or corrupt.
+
+    The file is opened with ``O_NOFOLLOW`` and ``O_NONBLOCK`` (so a FIFO at the
+    path cannot block the open) and ignored unless it is a regular file owned
+    by the current user and not accessible to group or others.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_NONBLOCK", 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return {}
+    try:
+        with os.fdopen(fd, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                return {}
+            if hasattr(os, "getuid") and (
+                st.st_uid != os.getuid() or st.st_mode & 0o077
+            ):
+                return {}
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_jwt_cache(path: Path, entries: dict) -> None:
+    """Atomically replace the JWT cache file with ``entries`` (mode 0600)."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json.dumps(entries))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
 
 class BackendCaptionSender:
     """Send live captions via an lcyt-backend relay server.
@@ -38,36 +138,121 @@ class BackendCaptionSender:
         domain: str = "http://localhost",
         sequence: int = 0,
         verbose: bool = False,
+        jwt_cache: bool | str | os.PathLike = False,
+        auto_batch_ms: int = 0,
     ):
         """Initialize the backend relay sender.
 
         Args:
             backend_url: Base URL of the lcyt-backend server
-                         (e.g. ``"https://captions.example.com"``).
+                         (e.g. ``"https://captions.example.com"``). Proxies
+                         from ``HTTP(S)_PROXY``/``NO_PROXY`` are used;
+                         redirects are not followed.
             api_key: API key registered in the backend's SQLite database.
             stream_key: YouTube stream key.
             domain: CORS origin that the session will be associated with.
                     Defaults to ``"http://localhost"``.
             sequence: Starting sequence number (overridden by server on start()).
             verbose: Enable verbose logging.
+            jwt_cache: Reuse the session JWT across processes. ``True`` uses
+                       ``~/.lcyt_jwt_cache``; a path uses that file instead.
+                       Saves the registration round-trip in ``start()`` for
+                       short-lived scripts. Disabled by default.
+            auto_batch_ms: If > 0, ``send()`` queues the caption and returns
+                           immediately; everything queued within this many
+                           milliseconds goes out as one ``POST /captions``.
+                           Call ``flush()`` to send early. Disabled by default.
         """
         self._backend_url = backend_url.rstrip("/")
+        parsed = urlsplit(self._backend_url)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path
+        # Route through the same proxy urllib would. https is tunnelled with
+        # CONNECT; plain http sends absolute URLs to the proxy.
+        self._proxy = _proxy_for(parsed.scheme, parsed.hostname or "")
+        self._url_prefix = self._base_path
+        self._proxy_headers: dict = {}
+        if self._proxy is not None and self._scheme != "https":
+            self._url_prefix = f"{self._scheme}://{self._netloc}{self._base_path}"
+            self._proxy_headers = _proxy_auth_headers(self._proxy)
+        self._conn: http.client.HTTPConnection | None = None
         self._api_key = api_key
         self._stream_key = stream_key
         self._domain = domain
         self._sequence = sequence
         self._verbose = verbose
+        if jwt_cache is True:
+            self._jwt_cache: Path | None = _jwt_cache_path()
+        elif jwt_cache:
+            self._jwt_cache = Path(jwt_cache)
+        else:
+            self._jwt_cache = None
+        self._jwt_cache_key = _jwt_cache_key(self._backend_url, api_key, stream_key)
+        self._token_from_cache = False
+        self._auto_batch_ms = auto_batch_ms
 
         self._is_started = False
         self._sync_offset: int = 0
         self._started_at: float = 0.0
-        self._token: str | None = None
+        self._token = None
         self._queue: list[dict] = []
 
+        # With auto-batching a timer thread sends too: guard the queue and
+        # the keep-alive connection, which http.client does not make safe.
+        self._queue_lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+        # One auto-batch flush at a time, so end() can wait out a running one.
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._flush_error: NetworkError | None = None
+
+    # ------------------------------------------------------------------
+    # Session token
+    # ------------------------------------------------------------------
+
+    @property
+    def _token(self) -> str | None:
+        return self._jwt
+
+    @_token.setter
+    def _token(self, token: str | None) -> None:
+        # The authenticated header dict is built once per token, not per request.
+        self._jwt = token
+        self._auth_headers = (
+            {**_JSON_HEADERS, "Authorization": f"Bearer {token}"} if token else None
+        )
+
     # ------------------------------------------------------------------
     # Internal fetch helper
     # ------------------------------------------------------------------
 
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return the keep-alive connection to the backend, opening it if needed."""
+        if self._conn is None:
+            conn_class = (
+                http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            )
+            if self._proxy is None:
+                self._conn = conn_class(self._netloc, timeout=30)
+            else:
+                proxy = urlsplit(self._proxy)
+                self._conn = conn_class(proxy.hostname, proxy.port, timeout=30)
+                if self._scheme == "https":
+                    self._conn.set_tunnel(self._netloc, headers=_proxy_auth_headers(self._proxy))
+        return self._conn
+
+    def close(self) -> None:
+        """Close the keep-alive connection to the backend, if open."""
+        with self._conn_lock:
+            self._close_conn()
+
+    def _close_conn(self) -> None:
+        """Close and drop the connection. Caller holds ``_conn_lock``."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def _fetch(
         self,
         path: str,
@@ -75,7 +260,7 @@ class BackendCaptionSender:
         body: dict | None = None,
         auth: bool = True,
     ) -> dict:
-        """Make a JSON request to the backend.
+        """Make a JSON request to the backend over the keep-alive connection.
 
         Args:
             path: Endpoint path (e.g. ``"/live"``).
@@ -89,25 +274,65 @@ class BackendCaptionSender:
         Raises:
             NetworkError: On non-2xx response or network failure.
         """
-        url = f"{self._backend_url}{path}"
-        data = json.dumps(body).encode() if body is not None else None
-
-        headers = {"Content-Type": "application/json"}
-        if auth and self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+        try:
+            return self._request(path, method, body, auth)
+        except NetworkError as exc:
+            if not (auth and self._token_from_cache and exc.status_code in (401, 404)):
+                raise
+        # The cached JWT was rejected or its session is gone (e.g. the backend
+        # restarted): forget it, register afresh and retry once.
+        self._forget_cached_token()
+        self._register()
+        return self._request(path, method, body, auth)
+
+    def _request(
+        self,
+        path: str,
+        method: str,
+        body: dict | None,
+        auth: bool,
+    ) -> dict:
+        """Send one request over the keep-alive connection; see ``_fetch``."""
+        url = f"{self._url_prefix}{path}"
+        data = _json.dumps(body) if body is not None else None
 
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        headers = (auth and self._auth_headers) or _JSON_HEADERS
+        if self._proxy_headers:
+            headers = {**headers, **self._proxy_headers}
 
-        try:
-            with urllib.request.urlopen(req) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as exc:
+        with self._conn_lock:
+            try:
+                # Only an already-open socket can have gone stale; a connection
+                # whose socket was closed reconnects inside request().
+                reused = self._conn is not None and self._conn.sock is not None
+                conn = self._connection()
+                try:
+                    conn.request(method, url, data, headers)
+                    resp = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    if not reused:
+                        raise
+                    # The server closed the idle keep-alive connection; the
+                    # request never reached it, so retry once on a fresh one.
+                    conn.close()
+                    conn.request(method, url, data, headers)
+                    resp = conn.getresponse()
+                raw = resp.read()
+            except Exception as exc:
+                # Still under the lock, so no other thread is using the
+                # connection being dropped.
+                self._close_conn()
+                raise NetworkError(str(exc)) from exc
+
+        if resp.status >= 400:
             try:
-                error_body = json.loads(exc.read())
-                msg = error_body.get("error", f"HTTP {exc.code}")
+                msg = _json.loads(raw).get("error", f"HTTP {resp.status}")
             except Exception:
-                msg = f"HTTP {exc.code}"
-            raise NetworkError(msg, exc.code) from exc
+                msg = f"HTTP {resp.status}"
+            raise NetworkError(msg, resp.status)
+
+        try:
+            return _json.loads(raw)
         except Exception as exc:
             raise NetworkError(str(exc)) from exc
 
@@ -125,9 +350,23 @@ class BackendCaptionSender:
         Returns:
             Self for method chaining.
 
+        With ``jwt_cache`` enabled, a cached JWT for the same backend, API key
+        and stream key that is valid for at least another 10 minutes is reused
+        without contacting the backend.
+
         Raises:
             NetworkError: If the registration request fails.
         """
+        if self._jwt_cache is not None:
+            entry = _read_jwt_cache(self._jwt_cache).get(self._jwt_cache_key)
+            if isinstance(entry, dict) and self._apply_cached_token(entry):
+                return self
+
+        self._register()
+        return self
+
+    def _register(self) -> None:
+        """POST /live and adopt the returned session, caching it if enabled."""
         data = self._fetch(
             "/live",
             method="POST",
@@ -145,21 +384,76 @@ class BackendCaptionSender:
         self._sync_offset = data["syncOffset"]
         self._started_at = data["startedAt"]
         self._is_started = True
+        self._token_from_cache = False
+
+        exp = _token_exp(self._token)
+        if self._jwt_cache is not None and exp is not None:
+            entries = _read_jwt_cache(self._jwt_cache)
+            entries[self._jwt_cache_key] = {
+                "token": self._token,
+                "exp": exp,
+                "sequence": self._sequence,
+                "syncOffset": self._sync_offset,
+                "startedAt": self._started_at,
+            }
+            _write_jwt_cache(self._jwt_cache, entries)
 
-        return self
+    def _apply_cached_token(self, entry: dict) -> bool:
+        """Adopt a cached session entry if it has enough lifetime left."""
+        try:
+            if entry["exp"] - _time.time() <= JWT_CACHE_MIN_TTL:
+                return False
+            self._token = entry["token"]
+            self._sequence = entry["sequence"]
+            self._sync_offset = entry["syncOffset"]
+            self._started_at = entry["startedAt"]
+        except (KeyError, TypeError):
+            return False
+        self._is_started = True
+        self._token_from_cache = True
+        return True
+
+    def _forget_cached_token(self) -> None:
+        """Drop this sender's entry from the JWT cache file, if any."""
+        self._token_from_cache = False
+        if self._jwt_cache is None:
+            return
+        entries = _read_jwt_cache(self._jwt_cache)
+        if entries.pop(self._jwt_cache_key, None) is not None:
+            _write_jwt_cache(self._jwt_cache, entries)
 
     def end(self) -> "BackendCaptionSender":
-        """Tear down the backend session and clear the stored JWT.
+        """Tear down the backend session, clear the stored JWT and close the connection.
+
+        Any captions still waiting for an auto-batch flush are sent first,
+        after a background flush already in progress has finished. That
+        includes captions a failed background flush put back in the queue.
 
         Returns:
             Self for method chaining.
 
         Raises:
-            NetworkError: If the request fails.
+            NetworkError: If the ``DELETE /live`` request fails, or, once the
+                          session is torn down, if the final flush failed.
         """
+        flush_error = None
+        if self._auto_batch_ms > 0:
+            with self._flush_lock:
+                try:
+                    self._flush(retry=False)
+                except NetworkError as exc:
+                    # Still tear the session down; report the flush failure after.
+                    flush_error = exc
+                # Failed captions are always re-queued, so an earlier
+                # background error is superseded by the flush above.
+                self._flush_error = None
         self._fetch("/live", method="DELETE")
+        self._forget_cached_token()
+        self.close()
         self._token = None
         self._is_started = False
+        if flush_error is not None:
+            raise flush_error
         return self
 
     # ------------------------------------------------------------------
@@ -182,11 +476,17 @@ class BackendCaptionSender:
                   ``startedAt + time + syncOffset``. Mutually exclusive with
                   ``timestamp``.
 
+        With ``auto_batch_ms`` set, the caption is queued instead and sent
+        with the others queued before the deadline.
+
         Returns:
-            Backend response dict: ``{sequence, timestamp, statusCode, serverTimestamp}``.
+            Backend response dict: ``{sequence, timestamp, statusCode, serverTimestamp}``,
+            or ``{queued}`` (current queue length) when auto-batching.
 
         Raises:
-            NetworkError: If the request fails.
+            NetworkError: If the request fails, or if the previous background
+                          auto-batch flush failed (this caption is queued
+                          regardless, and the failed ones are retried).
         """
         caption: dict[str, Any] = {"text": text}
         if time is not None:
@@ -194,6 +494,14 @@ class BackendCaptionSender:
         elif timestamp is not None:
             caption["timestamp"] = timestamp
 
+        if self._auto_batch_ms > 0:
+            with self._queue_lock:
+                self._queue.append(caption)
+                queued = len(self._queue)
+                self._start_flush_timer()
+            self._raise_flush_error()
+            return {"queued": queued}
+
         data = self._fetch("/captions", method="POST", body={"captions": [caption]})
         self._sequence = data.get("sequence", self._sequence)
         return data
@@ -216,8 +524,8 @@ class BackendCaptionSender:
             NetworkError: If the request fails.
         """
         if captions is None:
-            items = list(self._queue)
-            self._queue.clear()
+            with self._queue_lock:
+                items, self._queue = self._queue, []
         else:
             items = captions
 
@@ -225,6 +533,74 @@ class BackendCaptionSender:
         self._sequence = data.get("sequence", self._sequence)
         return data
 
+    def flush(self) -> dict | None:
+        """Send everything queued by auto-batching ``send()`` or ``construct()`` now.
+
+        Returns:
+            Backend response dict as for ``send_batch()``, or None if the
+            queue was empty.
+
+        Raises:
+            NetworkError: If the request fails (the captions stay queued), or
+                          if the previous background flush failed.
+        """
+        self._raise_flush_error()
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self, retry: bool = True) -> dict | None:
+        """Drain the queue into one ``POST /captions``. Caller holds ``_flush_lock``.
+
+        On failure the captions are put back at the head of the queue and,
+        if *retry* is set and auto-batching is on, the timer is restarted so
+        they go out again without waiting for an explicit ``flush()``.
+        """
+        with self._queue_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            items, self._queue = self._queue, []
+        if not items:
+            return None
+
+        try:
+            data = self._fetch("/captions", method="POST", body={"captions": items})
+        except NetworkError:
+            with self._queue_lock:
+                self._queue[:0] = items
+                if retry and self._auto_batch_ms > 0:
+                    self._start_flush_timer()
+            raise
+        self._sequence = data.get("sequence", self._sequence)
+        return data
+
+    def _start_flush_timer(self) -> None:
+        """Schedule a background flush unless one is pending. Caller holds ``_queue_lock``."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(
+                self._auto_batch_ms / 1000, self._flush_in_background
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_in_background(self) -> None:
+        """Timer callback: flush, keeping any error for the caller's next call."""
+        with self._flush_lock:
+            with self._queue_lock:
+                # A flush that ran while this timer waited may have scheduled a new one.
+                if self._flush_timer is threading.current_thread():
+                    self._flush_timer = None
+            try:
+                self._flush()
+            except NetworkError as exc:
+                self._flush_error = exc
+
+    def _raise_flush_error(self) -> None:
+        """Re-raise a failure from the last background flush, once."""
+        exc, self._flush_error = self._flush_error, None
+        if exc is not None:
+            raise exc
+
     # ------------------------------------------------------------------
     # Local queue (construct / send_batch pattern)
     # ------------------------------------------------------------------
@@ -252,12 +628,21 @@ class BackendCaptionSender:
             item["time"] = time
         elif timestamp is not None:
             item["timestamp"] = timestamp
-        self._queue.append(item)
-        return len(self._queue)
+        with self._queue_lock:
+            self._queue.append(item)
+            return len(self._queue)
 
-    def get_queue(self) -> list[dict]:
-        """Return a copy of the current local queue."""
-        return list(self._queue)
+    def get_queue(self) -> tuple[dict, ...]:
+        """Return a read-only snapshot of the current local queue.
+
+        Use ``list(sender.get_queue())`` if a mutable copy is needed, or
+        ``get_queue_length()`` to just count the queued captions.
+        """
+        return tuple(self._queue)
+
+    def get_queue_length(self) -> int:
+        """Return the number of captions in the local queue without copying it."""
+        return len(self._queue)
 
     def clear_queue(self) -> int:
         """Clear the local queue.
@@ -265,8 +650,9 @@ class BackendCaptionSender:
         Returns:
             Number of items cleared.
         """
-        count = len(self._queue)
-        self._queue.clear()
+        with self._queue_lock:
+            count = len(self._queue)
+            self._queue.clear()
         return count
 
     # ------------------------------------------------------------------
@@ -1,10 +1,10 @@
 """Configuration management for LCYT."""
 
-import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from . import _json
 from .errors import ConfigError
 
 DEFAULT_BASE_URL = "http://upload.youtube.com/closedcaption"
@@ -23,7 +23,14 @@ class LCYTConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
-        return asdict(self)
+        # Flat fields only, so skip asdict()'s recursive deepcopy.
+        return {
+            "stream_key": self.stream_key,
+            "base_url": self.base_url,
+            "region": self.region,
+            "cue": self.cue,
+            "sequence": self.sequence,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "LCYTConfig":
@@ -64,14 +71,17 @@ def load_config(config_path: Path | str | None = None) -> LCYTConfig:
         return LCYTConfig()
 
     try:
-        with open(config_path) as f:
-            data = json.load(f)
-        return LCYTConfig.from_dict(data)
-    except json.JSONDecodeError as e:
-        raise ConfigError(f"Invalid JSON in config file: {e}") from e
+        with open(config_path, "rb") as f:
+            raw = f.read()
     except OSError as e:
         raise ConfigError(f"Cannot read config file: {e}") from e
 
+    try:
+        data = _json.loads(raw)
+    except ValueError as e:  # json/orjson decode errors, bad UTF-8
+        raise ConfigError(f"Invalid JSON in config file: {e}") from e
+    return LCYTConfig.from_dict(data)
+
 
 def save_config(config: LCYTConfig, config_path: Path | str | None = None) -> None:
     """Save configuration to file.
@@ -89,8 +99,8 @@ def save_config(config: LCYTConfig, config_path: Path | str | None = None) -> No
         config_path = Path(config_path)
 
     try:
-        with open(config_path, "w") as f:
-            json.dump(config.to_dict(), f, indent=2)
+        with open(config_path, "wb") as f:
+            f.write(_json.dumps_indented(config.to_dict()))
     except OSError as e:
         raise ConfigError(f"Cannot write config file: {e}") from e
 
@@ -1,20 +1,82 @@
 """YouTube Live Caption Sender."""
 
+import functools
 import http.client
 import logging
+import re
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from .config import DEFAULT_BASE_URL, build_ingestion_url, LCYTConfig
 from .errors import NetworkError, ValidationError
 
 logger = logging.getLogger("lcyt")
 
+# Shared by every httpx/aiohttp POST; the client adds Content-Length.
+_TEXT_HEADERS = {"Content-Type": "text/plain"}
 
-@dataclass
+
+@functools.lru_cache(maxsize=64)
+def _utc_second_prefix(epoch_sec: int) -> str:
+    """Return ``YYYY-MM-DDTHH:MM:SS`` for a whole UTC epoch second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_sec))
+
+
+# ISO timestamp with optional fraction and an optional Z / ±HH:MM suffix.
+_ISO_TS_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(?:Z|[+-]\d{2}:\d{2})?"
+)
+
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _parse_server_timestamp_ms(ts: str) -> int:
+    """Parse a server timestamp (``YYYY-MM-DDTHH:MM:SS.mmm``, UTC) into epoch ms.
+
+    Stays naive throughout: no tzinfo is attached and no float timestamp is
+    produced. Any UTC offset in ``ts`` is ignored, as the server sends none.
+
+    Raises:
+        ValueError: If ``ts`` is not an ISO 8601 timestamp.
+    """
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return (dt - _NAIVE_EPOCH) // _ONE_MS
+
+
+def _format_epoch_ms(epoch_ms: int) -> str:
+    """Format integer epoch milliseconds as ``YYYY-MM-DDTHH:MM:SS.mmm`` (UTC).
+
+    Captions generated together share a second, so the date part is cached
+    and only the milliseconds are formatted per caption.
+    """
+    sec, ms = divmod(epoch_ms, 1000)
+    return f"{_utc_second_prefix(sec)}.{ms:03d}"
+
+
+@functools.lru_cache(maxsize=64)
+def _utc_second_prefix_bytes(epoch_sec: int) -> bytes:
+    """``_utc_second_prefix()`` as ASCII bytes."""
+    return _utc_second_prefix(epoch_sec).encode("ascii")
+
+
+_MS_SUFFIXES = tuple(b".%03d" % ms for ms in range(1000))
+
+
+def _epoch_ms_bytes(epoch_ms: int) -> bytes:
+    """``_format_epoch_ms()`` as ASCII bytes, for writing straight into a POST body."""
+    sec, ms = divmod(epoch_ms, 1000)
+    return _utc_second_prefix_bytes(sec) + _MS_SUFFIXES[ms]
+
+
+@dataclass(slots=True)
 class Caption:
     """A single caption with text and optional timestamp."""
 
@@ -22,7 +84,7 @@ class Caption:
     timestamp: str | datetime | int | float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SendResult:
     """Result of a send operation."""
 
@@ -34,18 +96,11 @@ class SendResult:
     count: int | None = None
 
 
-class YoutubeLiveCaptionSender:
-    """Send live captions to YouTube streams.
+class _CaptionSenderBase:
+    """State, queue and payload formatting shared by the sync and async senders.
 
-    This class provides methods to send captions to YouTube's live caption
-    ingestion endpoint. It supports single captions, batch sending, and
-    queue-based workflows.
-
-    Example:
-        >>> sender = YoutubeLiveCaptionSender(stream_key="YOUR_KEY")
-        >>> sender.start()
-        >>> result = sender.send("Hello, world!")
-        >>> sender.end()
+    Subclasses supply the transport (``start``/``end``, ``send*``, ``heartbeat``,
+    ``sync`` and ``_send_post``); everything here is I/O-free.
     """
 
     def __init__(
@@ -59,6 +114,10 @@ class YoutubeLiveCaptionSender:
         sequence: int = 0,
         use_sync_offset: bool = False,
         verbose: bool = False,
+        max_batch_size: int | None = None,
+        max_batch_delay_ms: int | None = None,
+        use_http2: bool = False,
+        max_queue_size: int | None = None,
     ):
         """Initialize the caption sender.
 
@@ -73,6 +132,22 @@ class YoutubeLiveCaptionSender:
             use_sync_offset: Apply syncOffset to auto-generated timestamps.
                              Set automatically to True after calling sync().
             verbose: Enable debug logging.
+            max_batch_size: If set, the queue is sent as one batch once it
+                            holds this many captions.
+            max_batch_delay_ms: If set, the queue is sent once its oldest
+                                caption has waited this long. Both limits are
+                                off by default and only apply to
+                                ``YoutubeLiveCaptionSender``, which sends from
+                                a background thread so ``construct()`` never
+                                waits on the network.
+            use_http2: Send through an ``httpx`` client that negotiates HTTP/2
+                       on https ingestion URLs. Requires
+                       ``lcyt[http2]``; only applies to
+                       ``YoutubeLiveCaptionSender``.
+            max_queue_size: If set, ``construct()`` drops the oldest queued
+                            caption when the queue already holds this many,
+                            so a stalled connection cannot grow it without
+                            bound. Off by default.
         """
         self._stream_key = stream_key
         self._base_url = base_url
@@ -80,13 +155,38 @@ class YoutubeLiveCaptionSender:
         self._region = region
         self._cue = cue
         self._use_region = use_region
+        # Everything between a caption's timestamp and its text; fixed per sender.
+        self._header_end = f" region:{region}#{cue}\n" if use_region else "\n"
+        self._header_end_bytes = self._header_end.encode("utf-8")
         self._sequence = sequence
-        self._sync_offset: int = 0   # Clock offset in ms (positive = server ahead)
+        self._sync_offset_ns: int = 0   # Clock offset in ns (positive = server ahead)
         self._use_sync_offset = use_sync_offset
         self._verbose = verbose
 
         self._queue: list[Caption] = []
+        # id(caption) -> (text, UTF-8 bytes) encoded by construct(); an entry
+        # is ignored once the caption's text is reassigned.
+        self._encoded: dict[int, tuple[str, bytes]] = {}
         self._started = False
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay_ms = max_batch_delay_ms
+        self._max_queue_size = max_queue_size
+        self._batch_opened_at_ms: int | None = None   # _monotonic_ms() of the oldest caption
+        # Guards the queue; the sync sender's flusher thread waits on it.
+        self._queue_cv = threading.Condition()
+
+        # Transport handle (an http.client connection, an httpx client or an
+        # aiohttp session), opened on first use. The lock keeps threaded
+        # callers to one request at a time on a shared HTTP/1.1 connection.
+        self._use_http2 = use_http2
+        self._conn: Any = None
+        self._conn_lock = threading.Lock()
+        # Held from reading the sequence number until the POST completes, so
+        # concurrent sends never reuse one. The async sender swaps in an
+        # asyncio.Lock in start().
+        self._send_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._flush_error: NetworkError | None = None
 
         if verbose:
             logging.basicConfig(level=logging.DEBUG)
@@ -96,19 +196,30 @@ class YoutubeLiveCaptionSender:
     # Internal time helper
     # ------------------------------------------------------------------
 
-    def _now_ms(self) -> float:
+    def _now_ns(self) -> int:
+        """Return current time in epoch nanoseconds, adjusted by sync offset."""
+        if self._use_sync_offset:
+            return time.time_ns() + self._sync_offset_ns
+        return time.time_ns()
+
+    def _now_ms(self) -> int:
         """Return current time in epoch milliseconds, adjusted by sync offset."""
-        return time.time() * 1000 + (self._sync_offset if self._use_sync_offset else 0)
+        return self._now_ns() // 1_000_000
+
+    @staticmethod
+    def _monotonic_ms() -> int:
+        """Return monotonic milliseconds, for measuring how long a batch has waited.
+
+        Unlike ``_now_ms()``, unaffected by ``sync()`` or system clock steps.
+        """
+        return time.monotonic_ns() // 1_000_000
 
     # ------------------------------------------------------------------
-    # Lifecycle
+    # Lifecycle helpers
     # ------------------------------------------------------------------
 
-    def start(self) -> "YoutubeLiveCaptionSender":
-        """Initialize the sender. Must be called before sending captions.
-
-        Returns:
-            Self for method chaining.
+    def _resolve_url(self) -> None:
+        """Resolve and split the ingestion URL.
 
         Raises:
             ValidationError: If stream_key or ingestion_url is not set.
@@ -127,57 +238,20 @@ class YoutubeLiveCaptionSender:
                 field="stream_key",
             )
 
-        self._started = True
-        logger.debug(f"Sender started with URL: {self._url}")
-        return self
-
-    def end(self) -> "YoutubeLiveCaptionSender":
-        """Stop the sender and cleanup.
-
-        Returns:
-            Self for method chaining.
-        """
-        self._started = False
-        self._queue.clear()
-        logger.debug(f"Caption sender stopped. Total captions sent: {self._sequence}")
-        return self
+        # Split the URL once; each POST only appends its seq parameter.
+        parsed = urlsplit(self._url)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._request_path = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        self._seq_separator = "&" if parsed.query else "?"
+        self._post_url_prefix = (
+            f"{self._scheme}://{self._netloc}{self._request_path}{self._seq_separator}seq="
+        )
 
     # ------------------------------------------------------------------
-    # Sending
+    # Queueing
     # ------------------------------------------------------------------
 
-    def send(self, text: str, timestamp: str | datetime | int | float | None = None) -> SendResult:
-        """Send a single caption.
-
-        Args:
-            text: Caption text to send.
-            timestamp: Optional timestamp. Accepted forms:
-
-                - ``datetime`` object (timezone-aware or naive UTC)
-                - ``int``/``float`` >= 1000: Unix epoch in seconds (``time.time()`` style)
-                - ``int``/``float`` < 1000 or negative: relative offset in seconds from now
-                  (e.g. ``-2`` = 2 seconds ago). Sync offset is applied when enabled.
-                - ISO string ``YYYY-MM-DDTHH:MM:SS.mmm`` (used as-is)
-                - ISO string with trailing ``Z`` or ``+00:00`` (auto-stripped)
-                - ``None``: auto-generated current time (sync offset applied if enabled)
-
-        Returns:
-            SendResult. The ``timestamp`` field is set to the formatted string sent.
-
-        Raises:
-            ValidationError: If sender not started or text is empty.
-            NetworkError: If HTTP request fails.
-        """
-        self._ensure_started()
-        if not text:
-            raise ValidationError("Caption text cannot be empty", field="text")
-
-        result = self.send_batch([Caption(text=text, timestamp=timestamp)])
-        # Populate the timestamp field to mirror Node.js send() return shape
-        if timestamp is not None:
-            result.timestamp = self._format_timestamp(timestamp)
-        return result
-
     def construct(self, text: str, timestamp: str | datetime | int | float | None = None) -> int:
         """Queue a caption for batch sending.
 
@@ -185,6 +259,9 @@ class YoutubeLiveCaptionSender:
             text: Caption text to queue.
             timestamp: Optional timestamp. Accepts the same forms as ``send()``.
 
+        If ``max_queue_size`` is set and the queue is full, the oldest queued
+        caption is dropped to make room.
+
         Returns:
             Current queue length.
 
@@ -194,83 +271,186 @@ class YoutubeLiveCaptionSender:
         self._ensure_started()
         if not text or not isinstance(text, str):
             raise ValidationError("Caption text is required and must be a string.", field="text")
-        self._queue.append(Caption(text=text, timestamp=timestamp))
-        logger.debug(f"Caption queued, queue length: {len(self._queue)}")
-        return len(self._queue)
+        caption = Caption(text=text, timestamp=timestamp)
+        # Encode now so the send path does not have to.
+        encoded = (text, text.encode("utf-8"))
+        with self._queue_cv:
+            if not self._queue:
+                self._batch_opened_at_ms = self._monotonic_ms()
+            elif self._max_queue_size is not None and len(self._queue) >= self._max_queue_size:
+                # A late caption is worth less than the newest one on a live stream.
+                self._encoded.pop(id(self._queue[0]), None)
+                del self._queue[0]
+                logger.debug("Caption queue full, dropped the oldest caption")
+            self._queue.append(caption)
+            self._encoded[id(caption)] = encoded
+            count = len(self._queue)
+        logger.debug("Caption queued, queue length: %d", count)
+        return count
 
-    def send_batch(self, captions: list[Caption] | None = None) -> SendResult:
-        """Send a batch of captions.
+    def get_queue(self) -> list[Caption]:
+        """Get a copy of the current caption queue."""
+        return self._queue.copy()
 
-        Args:
-            captions: List of captions to send. If None, sends queued captions.
+    def clear_queue(self) -> int:
+        """Clear all queued captions.
 
         Returns:
-            SendResult with sequence, count, status code, and response.
+            Number of captions cleared.
+        """
+        with self._queue_cv:
+            count = len(self._queue)
+            self._queue.clear()
+            self._encoded.clear()
+            self._batch_opened_at_ms = None
+        logger.debug("Cleared %d caption(s) from queue", count)
+        return count
 
-        Raises:
-            ValidationError: If sender not started or no captions to send.
-            NetworkError: If HTTP request fails.
+    # ------------------------------------------------------------------
+    # Sequence management
+    # ------------------------------------------------------------------
+
+    def get_sequence(self) -> int:
+        """Get the current sequence number."""
+        return self._sequence
+
+    def set_sequence(self, sequence: int) -> "_CaptionSenderBase":
+        """Set the sequence number manually."""
+        self._sequence = sequence
+        return self
+
+    # ------------------------------------------------------------------
+    # Sync offset management
+    # ------------------------------------------------------------------
+
+    def get_sync_offset(self) -> int:
+        """Get the current sync offset in milliseconds.
+
+        Returns:
+            Clock offset in ms (positive = server ahead of local).
+        """
+        return self._sync_offset_ns // 1_000_000
+
+    def set_sync_offset(self, offset: int) -> "_CaptionSenderBase":
+        """Set the sync offset manually (e.g. to restore a previously computed offset).
+
+        Args:
+            offset: Clock offset in ms.
+
+        Returns:
+            Self for method chaining.
         """
+        self._sync_offset_ns = round(offset * 1_000_000)
+        return self
+
+    @property
+    def is_started(self) -> bool:
+        """Check if sender is started."""
+        return self._started
+
+    # ------------------------------------------------------------------
+    # Private implementation
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if not self._started:
+            raise ValidationError("Sender not started. Call start() first.")
+
+    def _batch_due(self) -> bool:
+        """Whether the queue has reached ``max_batch_size`` or ``max_batch_delay_ms``."""
+        if not self._queue:
+            return False
+        if self._max_batch_size is not None and len(self._queue) >= self._max_batch_size:
+            return True
+        # Read once: another thread may drain the queue and reset it to None.
+        opened_at_ms = self._batch_opened_at_ms
+        return (
+            self._max_batch_delay_ms is not None
+            and opened_at_ms is not None
+            and self._monotonic_ms() - opened_at_ms >= self._max_batch_delay_ms
+        )
+
+    def _take_batch(self, captions: list[Caption] | None) -> list[Caption]:
+        """Return the captions to send, draining the queue if ``captions`` is None."""
         self._ensure_started()
 
         if captions is None:
-            captions = self._queue.copy()
-            self._queue.clear()
+            with self._queue_cv:
+                # Hand the list itself to the caller; construct() appends to
+                # the fresh one.
+                captions, self._queue = self._queue, []
+                self._batch_opened_at_ms = None
 
         if not captions:
             raise ValidationError("No captions to send")
+        return captions
 
-        body_parts: list[str] = []
+    def _build_batch_body(self, captions: list[Caption]) -> bytes:
+        """Build the UTF-8 POST body for a batch of captions.
+
+        Same lines as ``_build_caption_body`` per caption, but every piece is
+        encoded as it is produced and goes into one list that is joined once,
+        so the whole body never exists as a ``str``.
+        """
+        header_end = self._header_end_bytes
+        parts: list[bytes] = []
+        append = parts.append
+        pop_encoded = self._encoded.pop
         base_time_ms = self._now_ms()
 
         for i, caption in enumerate(captions):
             if caption.timestamp:
-                ts = self._format_timestamp(caption.timestamp)
+                append(self._format_timestamp(caption.timestamp).encode("utf-8"))
             else:
                 # Space captions 100ms apart if no timestamp provided.
-                caption_time = datetime.fromtimestamp(
-                    (base_time_ms + i * 100) / 1000, tz=timezone.utc
-                )
-                ts = self._format_timestamp(caption_time)
+                append(_epoch_ms_bytes(base_time_ms + i * 100))
+            append(header_end)
+            text = caption.text
+            encoded = pop_encoded(id(caption), None)
+            append(encoded[1] if encoded is not None and encoded[0] is text else text.encode("utf-8"))
+            append(b"\n")
+
+        return b"".join(parts)
 
-            body_parts.append(self._build_caption_body(ts, caption.text))
+    def _build_single_body(
+        self, text: str, timestamp: str | datetime | int | float | None
+    ) -> tuple[str | None, bytes]:
+        """Build the POST body for one caption without a ``Caption`` or list.
 
-        body = "\n".join(body_parts) + "\n"
-        sent_sequence = self._sequence
-        result = self._send_post(body, sent_sequence)
+        Returns:
+            The formatted ``timestamp`` (None when it was auto-generated) and
+            the body, byte-identical to ``_build_batch_body([Caption(text, timestamp)])``.
+        """
+        if timestamp:
+            ts = self._format_timestamp(timestamp)
+            ts_bytes = ts.encode("utf-8")
+        else:
+            ts = None
+            ts_bytes = _epoch_ms_bytes(self._now_ms())
+        return ts, b"".join((ts_bytes, self._header_end_bytes, text.encode("utf-8"), b"\n"))
 
+    def _finish_batch(self, result: SendResult, sent_sequence: int, count: int) -> SendResult:
+        """Advance the sequence after a successful batch and build its result."""
         if 200 <= result.status_code < 300:
             self._sequence += 1
-            logger.debug(f"Sent batch #{sent_sequence}: {len(captions)} caption(s)")
+            logger.debug("Sent batch #%d: %d caption(s)", sent_sequence, count)
         else:
-            logger.debug(f"Batch #{sent_sequence} returned status {result.status_code}")
+            logger.debug("Batch #%d returned status %s", sent_sequence, result.status_code)
 
         return SendResult(
             sequence=sent_sequence,
-            count=len(captions),
+            count=count,
             status_code=result.status_code,
             response=result.response,
             server_timestamp=result.server_timestamp,
         )
 
-    def heartbeat(self) -> SendResult:
-        """Send a heartbeat (empty POST) to verify connection.
-
-        The heartbeat does not increment the sequence number per Google's spec.
-
-        Returns:
-            SendResult with status code and server timestamp.
-
-        Raises:
-            ValidationError: If sender not started.
-            NetworkError: If HTTP request fails.
-        """
-        self._ensure_started()
-        result = self._send_post("", self._sequence)
+    def _finish_heartbeat(self, result: SendResult) -> SendResult:
+        """Log a heartbeat response and build its result."""
         if 200 <= result.status_code < 300:
-            logger.debug(f"Heartbeat #{self._sequence} OK")
+            logger.debug("Heartbeat #%d OK", self._sequence)
         else:
-            logger.debug(f"Heartbeat #{self._sequence} returned status {result.status_code}")
+            logger.debug("Heartbeat #%d returned status %s", self._sequence, result.status_code)
         return SendResult(
             sequence=self._sequence,
             status_code=result.status_code,
@@ -278,256 +458,496 @@ class YoutubeLiveCaptionSender:
             server_timestamp=result.server_timestamp,
         )
 
-    def sync(self) -> dict:
-        """Synchronize the local clock with YouTube's server clock (NTP-style).
-
-        Sends a heartbeat, measures round-trip time, computes the midpoint
-        estimate of server time, and stores the offset as ``sync_offset``.
-        Automatically enables ``use_sync_offset`` so future auto-generated
-        timestamps are corrected.
-
-        Returns:
-            dict with keys:
-                ``sync_offset`` (int ms), ``round_trip_time`` (int ms),
-                ``server_timestamp`` (str | None), ``status_code`` (int).
-
-        Raises:
-            ValidationError: If sender not started.
-            NetworkError: If HTTP request fails.
-        """
-        self._ensure_started()
-
-        t1_wall_ms = time.time() * 1000
-        result = self.heartbeat()
-        t2_wall_ms = time.time() * 1000
-        rtt_ms = int(t2_wall_ms - t1_wall_ms)
+    def _finish_sync(self, t1_wall_ns: int, t2_wall_ns: int, result: SendResult) -> dict:
+        """Compute and store the clock offset from a timed heartbeat."""
+        rtt_ms = (t2_wall_ns - t1_wall_ns) // 1_000_000
 
         if not result.server_timestamp:
             logger.debug("No server timestamp in heartbeat response — syncOffset not updated")
             return {
-                "sync_offset": self._sync_offset,
+                "sync_offset": self.get_sync_offset(),
                 "round_trip_time": rtt_ms,
                 "server_timestamp": None,
                 "status_code": result.status_code,
             }
 
         # Parse server timestamp (format: YYYY-MM-DDTHH:MM:SS.mmm — no Z, treat as UTC)
-        server_time_ms = (
-            datetime.fromisoformat(result.server_timestamp)
-            .replace(tzinfo=timezone.utc)
-            .timestamp()
-        ) * 1000
-
-        local_estimate_ms = (t1_wall_ms + t2_wall_ms) / 2
-        self._sync_offset = round(server_time_ms - local_estimate_ms)
+        server_time_ns = _parse_server_timestamp_ms(result.server_timestamp) * 1_000_000
+
+        local_estimate_ns = (t1_wall_ns + t2_wall_ns) // 2
+        self._sync_offset_ns = server_time_ns - local_estimate_ns
         self._use_sync_offset = True
 
-        logger.debug(f"Synced: offset {self._sync_offset}ms, RTT {rtt_ms}ms")
+        sync_offset_ms = self.get_sync_offset()
+        logger.debug("Synced: offset %dms, RTT %dms", sync_offset_ms, rtt_ms)
 
         return {
-            "sync_offset": self._sync_offset,
+            "sync_offset": sync_offset_ms,
             "round_trip_time": rtt_ms,
             "server_timestamp": result.server_timestamp,
             "status_code": result.status_code,
         }
 
-    def send_test(self) -> SendResult:
-        """Send a test payload using current timestamps.
-
-        Uses the ``region:reg1#cue1`` format from Google's documentation.
-
-        Returns:
-            SendResult with status code and response.
-
-        Raises:
-            ValidationError: If sender not started.
-            NetworkError: If HTTP request fails.
-        """
-        self._ensure_started()
-
+    def _build_test_body(self) -> bytes:
+        """Build the two-caption ``region:reg1#cue1`` test payload."""
         now_ms = self._now_ms()
-        ts1 = self._format_timestamp(datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc))
-        ts2 = self._format_timestamp(
-            datetime.fromtimestamp((now_ms + 100) / 1000, tz=timezone.utc)
-        )
+        ts1 = _format_epoch_ms(now_ms)
+        ts2 = _format_epoch_ms(now_ms + 100)
 
-        body = (
+        return (
             f"{ts1} region:reg1#cue1\n"
             "HELLO\n"
             f"{ts2} region:reg1#cue1\n"
             "WORLD\n"
-        )
-
-        sent_sequence = self._sequence
-        result = self._send_post(body, sent_sequence)
+        ).encode("ascii")
 
+    def _finish_test(self, result: SendResult, sent_sequence: int) -> SendResult:
+        """Advance the sequence after a successful test payload."""
         if 200 <= result.status_code < 300:
             self._sequence += 1
-            logger.debug(f"Test sent #{sent_sequence}")
+            logger.debug("Test sent #%d", sent_sequence)
         else:
-            logger.debug(f"Test #{sent_sequence} returned status {result.status_code}")
-
+            logger.debug("Test #%d returned status %s", sent_sequence, result.status_code)
         return result
 
-    # ------------------------------------------------------------------
-    # Queue helpers
-    # ------------------------------------------------------------------
+    def _format_timestamp(self, timestamp: str | datetime | int | float) -> str:
+        """Format timestamp for YouTube API.
 
-    def get_queue(self) -> list[Caption]:
-        """Get a copy of the current caption queue."""
-        return self._queue.copy()
+        YouTube expects: YYYY-MM-DDTHH:MM:SS.mmm (milliseconds, no timezone suffix)
 
-    def clear_queue(self) -> int:
-        """Clear all queued captions.
+        Accepted inputs:
+        - ``datetime``: wall-clock fields, milliseconds always included
+        - ``int``/``float`` >= 1000: Unix epoch in **seconds** (time.time() convention)
+        - ``int``/``float`` < 1000 or negative: relative seconds offset from now
+          (sync offset applied when use_sync_offset is True)
+        - ISO string with or without trailing 'Z' or '+00:00'
+        """
+        if isinstance(timestamp, datetime):
+            # First 23 chars drop any UTC offset; no strftime involved.
+            return timestamp.isoformat(timespec="milliseconds")[:23]
+        if isinstance(timestamp, (int, float)):
+            if timestamp < 1000:
+                # Relative offset in seconds from now (sync offset applied)
+                return _format_epoch_ms((self._now_ns() + round(timestamp * 1e9)) // 1_000_000)
+            # Unix epoch in seconds (time.time() convention). Round to
+            # microseconds first, as datetime.fromtimestamp() does.
+            return _format_epoch_ms(round(timestamp * 1_000_000) // 1000)
+
+        m = _ISO_TS_RE.fullmatch(timestamp)
+        if m is None:
+            return self._format_timestamp_str(timestamp)
+        base, frac = m.groups()
+        # Exactly 3 fractional digits — YouTube rejects microseconds
+        return f"{base}.{frac[:3]:0<3}" if frac else base
+
+    @staticmethod
+    def _format_timestamp_str(timestamp: str) -> str:
+        """Best-effort clean-up for strings that are not plain ISO timestamps."""
+        # Strip trailing Z
+        if timestamp.endswith("Z"):
+            timestamp = timestamp[:-1]
+        # Strip +00:00 timezone offset
+        if "+" in timestamp:
+            timestamp = timestamp.split("+")[0]
+        # Truncate to milliseconds (3 decimal places) — YouTube rejects microseconds
+        if "." in timestamp:
+            base, frac = timestamp.rsplit(".", 1)
+            timestamp = f"{base}.{frac[:3]}"
+        return timestamp
 
-        Returns:
-            Number of captions cleared.
+    def _build_caption_body(self, timestamp: str, text: str) -> str:
+        """Build the caption body for a single caption.
+
+        Format (with region): ``{ts} region:{region}#{cue}\\n{text}``
+        Format (without):     ``{ts}\\n{text}``
         """
-        count = len(self._queue)
-        self._queue.clear()
-        logger.debug(f"Cleared {count} caption(s) from queue")
-        return count
+        return f"{timestamp}{self._header_end}{text}"
+
+    def _result_from_response(self, sequence: int, status: int, response_body: str) -> SendResult:
+        """Build the SendResult for a raw ingestion response."""
+        logger.debug("Response: %s %s", status, response_body)
+
+        server_timestamp = response_body.strip() if response_body.strip() else None
+
+        return SendResult(
+            sequence=sequence,
+            status_code=status,
+            response=response_body,
+            server_timestamp=server_timestamp,
+        )
+
+
+class YoutubeLiveCaptionSender(_CaptionSenderBase):
+    """Send live captions to YouTube streams.
+
+    This class provides methods to send captions to YouTube's live caption
+    ingestion endpoint. It supports single captions, batch sending, and
+    queue-based workflows.
+
+    Example:
+        >>> sender = YoutubeLiveCaptionSender(stream_key="YOUR_KEY")
+        >>> sender.start()
+        >>> result = sender.send("Hello, world!")
+        >>> sender.end()
+    """
 
     # ------------------------------------------------------------------
-    # Sequence management
+    # Lifecycle
     # ------------------------------------------------------------------
 
-    def get_sequence(self) -> int:
-        """Get the current sequence number."""
-        return self._sequence
+    def start(self) -> "YoutubeLiveCaptionSender":
+        """Initialize the sender. Must be called before sending captions.
 
-    def set_sequence(self, sequence: int) -> "YoutubeLiveCaptionSender":
-        """Set the sequence number manually."""
-        self._sequence = sequence
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValidationError: If stream_key or ingestion_url is not set.
+            ImportError: If ``use_http2`` is set and ``httpx``/``h2`` are not installed.
+        """
+        if self._use_http2:
+            try:
+                import h2  # noqa: F401
+                import httpx  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    'use_http2 requires httpx with HTTP/2 support: pip install "lcyt[http2]"'
+                ) from exc
+
+        self._resolve_url()
+        # Everything but the seq value and Content-Length is fixed per stream,
+        # so each POST only %-formats two integers into these bytes.
+        self._request_head = (
+            f"POST {self._request_path}{self._seq_separator}seq=%d HTTP/1.1\r\n"
+            f"Host: {self._netloc}\r\n"
+            "Accept-Encoding: identity\r\n"
+            "Content-Type: text/plain\r\n"
+            "Content-Length: %d\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        self.close()
+
+        self._started = True
+        auto_flush = self._max_batch_size is not None or self._max_batch_delay_ms is not None
+        if auto_flush and self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="lcyt-flusher", daemon=True
+            )
+            self._flusher.start()
+        logger.debug("Sender started with URL: %s", self._url)
+        return self
+
+    def end(self) -> "YoutubeLiveCaptionSender":
+        """Stop the sender, close its connection and cleanup.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._started = False
+        self._stop_flusher()
+        with self._queue_cv:
+            self._queue.clear()
+            self._encoded.clear()
+        self.close()
+        logger.debug("Caption sender stopped. Total captions sent: %d", self._sequence)
         return self
 
     # ------------------------------------------------------------------
-    # Sync offset management
+    # Sending
     # ------------------------------------------------------------------
 
-    def get_sync_offset(self) -> int:
-        """Get the current sync offset in milliseconds.
+    def send(self, text: str, timestamp: str | datetime | int | float | None = None) -> SendResult:
+        """Send a single caption.
+
+        Args:
+            text: Caption text to send.
+            timestamp: Optional timestamp. Accepted forms:
+
+                - ``datetime`` object (timezone-aware or naive UTC)
+                - ``int``/``float`` >= 1000: Unix epoch in seconds (``time.time()`` style)
+                - ``int``/``float`` < 1000 or negative: relative offset in seconds from now
+                  (e.g. ``-2`` = 2 seconds ago). Sync offset is applied when enabled.
+                - ISO string ``YYYY-MM-DDTHH:MM:SS.mmm`` (used as-is)
+                - ISO string with trailing ``Z`` or ``+00:00`` (auto-stripped)
+                - ``None``: auto-generated current time (sync offset applied if enabled)
 
         Returns:
-            Clock offset in ms (positive = server ahead of local).
+            SendResult. The ``timestamp`` field is set to the formatted string sent.
+
+        Raises:
+            ValidationError: If sender not started or text is empty.
+            NetworkError: If HTTP request fails.
         """
-        return self._sync_offset
+        self._ensure_started()
+        if not text:
+            raise ValidationError("Caption text cannot be empty", field="text")
 
-    def set_sync_offset(self, offset: int) -> "YoutubeLiveCaptionSender":
-        """Set the sync offset manually (e.g. to restore a previously computed offset).
+        ts, body = self._build_single_body(text, timestamp)
+        with self._send_lock:
+            sent_sequence = self._sequence
+            result = self._finish_batch(self._send_post(body, sent_sequence), sent_sequence, 1)
+        # Populate the timestamp field to mirror Node.js send() return shape
+        if timestamp is not None:
+            result.timestamp = ts
+        return result
+
+    def construct(self, text: str, timestamp: str | datetime | int | float | None = None) -> int:
+        """Queue a caption for batch sending.
+
+        If ``max_batch_size`` or ``max_batch_delay_ms`` is set, a background
+        thread sends the queue with ``send_batch()`` as soon as it reaches
+        either limit; this call only queues the caption and never waits on
+        the network.
 
         Args:
-            offset: Clock offset in ms.
+            text: Caption text to queue.
+            timestamp: Optional timestamp. Accepts the same forms as ``send()``.
 
         Returns:
-            Self for method chaining.
+            Current queue length.
+
+        Raises:
+            ValidationError: If sender not started or text is empty/not a string.
+            NetworkError: If the background send of an earlier batch failed.
         """
-        self._sync_offset = offset
-        return self
+        exc, self._flush_error = self._flush_error, None
+        if exc is not None:
+            raise exc
+
+        count = super().construct(text, timestamp)
+        if self._flusher is not None and (count == 1 or self._batch_due()):
+            # Wake the flusher: a new batch opened (start its deadline), or the
+            # batch is due now.
+            with self._queue_cv:
+                self._queue_cv.notify()
+        return count
 
-    @property
-    def is_started(self) -> bool:
-        """Check if sender is started."""
-        return self._started
+    def send_batch(self, captions: list[Caption] | None = None) -> SendResult:
+        """Send a batch of captions.
 
-    # ------------------------------------------------------------------
-    # Private implementation
-    # ------------------------------------------------------------------
+        Args:
+            captions: List of captions to send. If None, sends queued captions.
 
-    def _ensure_started(self) -> None:
-        if not self._started:
-            raise ValidationError("Sender not started. Call start() first.")
+        Returns:
+            SendResult with sequence, count, status code, and response.
 
-    def _format_timestamp(self, timestamp: str | datetime | int | float) -> str:
-        """Format timestamp for YouTube API.
+        Raises:
+            ValidationError: If sender not started or no captions to send.
+            NetworkError: If HTTP request fails.
+        """
+        captions = self._take_batch(captions)
+        body = self._build_batch_body(captions)
+        with self._send_lock:
+            sent_sequence = self._sequence
+            result = self._send_post(body, sent_sequence)
+            return self._finish_batch(result, sent_sequence, len(captions))
 
-        YouTube expects: YYYY-MM-DDTHH:MM:SS.mmm (milliseconds, no timezone suffix)
+    def heartbeat(self) -> SendResult:
+        """Send a heartbeat (empty POST) to verify connection.
 
-        Accepted inputs:
-        - ``datetime``: converted via isoformat()
-        - ``int``/``float`` >= 1000: Unix epoch in **seconds** (time.time() convention)
-        - ``int``/``float`` < 1000 or negative: relative seconds offset from now
-          (sync offset applied when use_sync_offset is True)
-        - ISO string with or without trailing 'Z' or '+00:00'
+        The heartbeat does not increment the sequence number per Google's spec.
+
+        Returns:
+            SendResult with status code and server timestamp.
+
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
         """
-        if isinstance(timestamp, datetime):
-            timestamp = timestamp.isoformat()
-        elif isinstance(timestamp, (int, float)):
-            if timestamp < 1000:
-                # Relative offset in seconds from now (sync offset applied)
-                dt = datetime.fromtimestamp(
-                    (self._now_ms() + timestamp * 1000) / 1000, tz=timezone.utc
-                )
-            else:
-                # Unix epoch in seconds (time.time() convention)
-                dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            timestamp = dt.isoformat()
+        self._ensure_started()
+        with self._send_lock:
+            return self._finish_heartbeat(self._send_post(b"", self._sequence))
 
-        # Strip trailing Z
-        if timestamp.endswith("Z"):
-            timestamp = timestamp[:-1]
-        # Strip +00:00 timezone offset
-        if "+" in timestamp:
-            timestamp = timestamp.split("+")[0]
-        # Truncate to milliseconds (3 decimal places) — YouTube rejects microseconds
-        if "." in timestamp:
-            base, frac = timestamp.rsplit(".", 1)
-            timestamp = f"{base}.{frac[:3]}"
-        return timestamp
+    def sync(self) -> dict:
+        """Synchronize the local clock with YouTube's server clock (NTP-style).
 
-    def _build_caption_body(self, timestamp: str, text: str) -> str:
-        """Build the caption body for a single caption.
+        Sends a heartbeat, measures round-trip time, computes the midpoint
+        estimate of server time, and stores the offset as ``sync_offset``.
+        Automatically enables ``use_sync_offset`` so future auto-generated
+        timestamps are corrected.
 
-        Format (with region): ``{ts} region:{region}#{cue}\\n{text}``
-        Format (without):     ``{ts}\\n{text}``
+        Returns:
+            dict with keys:
+                ``sync_offset`` (int ms), ``round_trip_time`` (int ms),
+                ``server_timestamp`` (str | None), ``status_code`` (int).
+
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
         """
-        if self._use_region:
-            return f"{timestamp} region:{self._region}#{self._cue}\n{text}"
-        return f"{timestamp}\n{text}"
+        self._ensure_started()
 
-    def _build_request_url(self, sequence: int) -> str:
-        separator = "&" if "?" in self._url else "?"
-        return f"{self._url}{separator}seq={sequence}"
+        with self._send_lock:
+            # Time only the heartbeat itself, not the wait for the lock.
+            t1_wall_ns = time.time_ns()
+            result = self._finish_heartbeat(self._send_post(b"", self._sequence))
+            t2_wall_ns = time.time_ns()
+        return self._finish_sync(t1_wall_ns, t2_wall_ns, result)
 
-    def _send_post(self, body: str, sequence: int) -> SendResult:
-        """Send HTTP POST request to YouTube."""
-        url = self._build_request_url(sequence)
-        parsed = urlparse(url)
+    def send_test(self) -> SendResult:
+        """Send a test payload using current timestamps.
 
-        logger.debug(f"POST {url}")
-        logger.debug(f"Body: {body!r}")
+        Uses the ``region:reg1#cue1`` format from Google's documentation.
 
-        try:
-            if parsed.scheme == "https":
-                conn = http.client.HTTPSConnection(parsed.netloc, timeout=30)
-            else:
-                conn = http.client.HTTPConnection(parsed.netloc, timeout=30)
+        Returns:
+            SendResult with status code and response.
 
-            path = parsed.path
-            if parsed.query:
-                path = f"{path}?{parsed.query}"
+        Raises:
+            ValidationError: If sender not started.
+            NetworkError: If HTTP request fails.
+        """
+        self._ensure_started()
+        with self._send_lock:
+            sent_sequence = self._sequence
+            result = self._send_post(self._build_test_body(), sent_sequence)
+            return self._finish_test(result, sent_sequence)
 
-            encoded = body.encode("utf-8")
-            headers = {
-                "Content-Type": "text/plain",
-                "Content-Length": str(len(encoded)),
-            }
+    # ------------------------------------------------------------------
+    # Background flusher (max_batch_size / max_batch_delay_ms)
+    # ------------------------------------------------------------------
 
-            conn.request("POST", path, encoded, headers)
-            response = conn.getresponse()
-            response_body = response.read().decode("utf-8")
-            conn.close()
+    def _flush_loop(self) -> None:
+        """Send the queue whenever it reaches ``max_batch_size`` or ``max_batch_delay_ms``.
 
-            logger.debug(f"Response: {response.status} {response_body}")
+        The only thread that sends automatically, so automatic batches never
+        overlap. Sleeps on the queue condition instead of polling: until the
+        batch deadline while a delay applies, otherwise until ``construct()``
+        or ``end()`` wakes it. The thread exits once it is no longer
+        ``self._flusher``.
+        """
+        me = threading.current_thread()
+        with self._queue_cv:
+            while self._flusher is me:
+                if not self._batch_due():
+                    timeout = None
+                    if self._queue and self._max_batch_delay_ms is not None:
+                        elapsed_ms = self._monotonic_ms() - self._batch_opened_at_ms
+                        timeout = (self._max_batch_delay_ms - elapsed_ms) / 1000
+                    self._queue_cv.wait(timeout)
+                    continue
+
+                # Send without holding the lock so construct() never blocks on I/O.
+                self._queue_cv.release()
+                try:
+                    self.send_batch()
+                except ValidationError:
+                    pass  # another thread drained the queue, or end() was called
+                except NetworkError as exc:
+                    logger.debug("Background flush failed: %s", exc)
+                    self._flush_error = exc
+                finally:
+                    self._queue_cv.acquire()
+
+    def _stop_flusher(self) -> None:
+        """Stop the flusher thread, if running, and wait for it to exit."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is None:
+            return
+        with self._queue_cv:
+            self._queue_cv.notify_all()
+        if flusher is not threading.current_thread():
+            flusher.join()
 
-            server_timestamp = response_body.strip() if response_body.strip() else None
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
 
-            return SendResult(
-                sequence=sequence,
-                status_code=response.status,
-                response=response_body,
-                server_timestamp=server_timestamp,
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return the keep-alive connection to the ingestion host, opening it if needed."""
+        if self._conn is None:
+            if self._use_http2:
+                import httpx
+
+                self._conn = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                    timeout=30.0,
+                )
+            elif self._scheme == "https":
+                self._conn = http.client.HTTPSConnection(self._netloc, timeout=30)
+            else:
+                self._conn = http.client.HTTPConnection(self._netloc, timeout=30)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the keep-alive connection to the ingestion host, if open."""
+        with self._conn_lock:
+            self._close_conn()
+
+    def _close_conn(self) -> None:
+        """Close and drop the connection. Caller holds ``_conn_lock``."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _exchange(conn: http.client.HTTPConnection, request: bytes) -> http.client.HTTPResponse:
+        """Write a pre-framed request to the connection's socket and read the response head.
+
+        Bypasses ``HTTPConnection.request()`` framing; the connection object
+        is still used to open the (TLS) socket and ``http.client`` still
+        parses the response.
+        """
+        if conn.sock is None:
+            conn.connect()
+        conn.sock.sendall(request)
+        response = conn.response_class(conn.sock, method="POST")
+        response.begin()
+        return response
+
+    def _send_post(self, body: bytes, sequence: int) -> SendResult:
+        """Send HTTP POST request to YouTube over the keep-alive connection."""
+        # repr() copies the whole body, so only build these lines when logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("POST %s%d", self._post_url_prefix, sequence)
+            logger.debug("Body: %r", body)
+
+        if self._use_http2:
+            return self._send_post_http2(body, sequence)
+
+        request = self._request_head % (sequence, len(body)) + body
+
+        with self._conn_lock:
+            try:
+                # Only an already-open socket can have gone stale; a connection
+                # dropped after "Connection: close" reconnects in _exchange().
+                reused = self._conn is not None and self._conn.sock is not None
+                conn = self._connection()
+                try:
+                    response = self._exchange(conn, request)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    if not reused:
+                        raise
+                    # YouTube closed the idle keep-alive connection before this
+                    # request reached it; retry once on a fresh connection.
+                    conn.close()
+                    response = self._exchange(conn, request)
+                response_body = response.read().decode("utf-8")
+                if response.will_close:
+                    conn.close()
+            except Exception as e:
+                # Still under the lock, so no other thread is using the
+                # connection being dropped.
+                self._close_conn()
+                raise NetworkError(f"HTTP request failed: {e}") from e
+
+        return self._result_from_response(sequence, response.status, response_body)
+
+    def _send_post_http2(self, body: bytes, sequence: int) -> SendResult:
+        """Send HTTP POST request through the shared ``httpx`` client.
+
+        The client is thread-safe, so ``_conn_lock`` is only held while
+        fetching it, not around the request.
+        """
+        try:
+            with self._conn_lock:
+                client = self._connection()
+            response = client.post(
+                f"{self._post_url_prefix}{sequence}", content=body, headers=_TEXT_HEADERS
             )
+            return self._result_from_response(sequence, response.status_code, response.text)
 
         except Exception as e:
+            # Keep the client: other threads may have requests in flight on
+            # it, and httpx replaces a broken connection itself.
             raise NetworkError(f"HTTP request failed: {e}") from e
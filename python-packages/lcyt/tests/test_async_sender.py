@@ -0,0 +1,203 @@
+"""Tests for AsyncYoutubeLiveCaptionSender (async_sender.py).
+
+Requests go to a throwaway aiohttp server on localhost, so no external
+network connections are made.
+"""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from lcyt.async_sender import AsyncYoutubeLiveCaptionSender  # noqa: E402
+from lcyt.errors import NetworkError, ValidationError  # noqa: E402
+from lcyt.sender import Caption, SendResult  # noqa: E402
+
+SERVER_TS = "2026-01-01T12:00:00.000"
+
+
+# ---------------------------------------------------------------------------
+# Helpers — local ingestion server
+# ---------------------------------------------------------------------------
+
+def _run_with_server(scenario, status=200, body=SERVER_TS):
+    """Run ``scenario(url, requests)`` against a local fake ingestion endpoint.
+
+    ``requests`` collects ``(query, body, peer)`` for each POST received.
+    """
+    requests = []
+
+    async def handle(request):
+        requests.append((
+            dict(request.query),
+            await request.text(),
+            request.transport.get_extra_info("peername"),
+        ))
+        return web.Response(status=status, text=body)
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/closedcaption", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            return await scenario(f"http://127.0.0.1:{port}/closedcaption?cid=KEY", requests)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+class TestLifecycle:
+    def test_start_requires_key_or_url(self):
+        async def scenario():
+            with pytest.raises(ValidationError):
+                await AsyncYoutubeLiveCaptionSender().start()
+
+        asyncio.run(scenario())
+
+    def test_send_before_start_raises(self):
+        async def scenario():
+            with pytest.raises(ValidationError):
+                await AsyncYoutubeLiveCaptionSender(stream_key="K").send("x")
+
+        asyncio.run(scenario())
+
+    def test_end_closes_session(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            session = s._conn
+            await s.end()
+            return session, s
+
+        session, s = _run_with_server(scenario)
+        assert session.closed
+        assert s._conn is None
+        assert s.is_started is False
+
+
+# ---------------------------------------------------------------------------
+# Sending
+# ---------------------------------------------------------------------------
+
+class TestSend:
+    def test_send_posts_caption_with_seq(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            result = await s.send("Hello", "2026-01-01T00:00:00.000")
+            await s.end()
+            return result, s, list(requests)
+
+        result, s, requests = _run_with_server(scenario)
+        assert isinstance(result, SendResult)
+        assert result.status_code == 200
+        assert result.sequence == 0
+        assert result.server_timestamp == SERVER_TS
+        assert result.timestamp == "2026-01-01T00:00:00.000"
+        assert s.get_sequence() == 1
+        query, body, _ = requests[0]
+        assert query == {"cid": "KEY", "seq": "0"}
+        assert body == "2026-01-01T00:00:00.000\nHello\n"
+
+    def test_requests_share_one_connection(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            await s.send("A")
+            await s.send_batch([Caption(text="B"), Caption(text="C")])
+            await s.heartbeat()
+            await s.end()
+            return list(requests)
+
+        requests = _run_with_server(scenario)
+        assert [q["seq"] for q, _, _ in requests] == ["0", "1", "2"]
+        assert len({peer for _, _, peer in requests}) == 1
+
+    def test_concurrent_sends_get_distinct_sequences(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            results = await asyncio.gather(*(s.send(f"c{i}") for i in range(4)))
+            await s.end()
+            return results, s, list(requests)
+
+        results, s, requests = _run_with_server(scenario)
+        assert [r.sequence for r in results] == [0, 1, 2, 3]
+        assert [q["seq"] for q, _, _ in requests] == ["0", "1", "2", "3"]
+        assert [body.split("\n")[1] for _, body, _ in requests] == ["c0", "c1", "c2", "c3"]
+        assert s.get_sequence() == 4
+
+    def test_debug_logging_includes_url_and_body(self, caplog):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            await s.send("logged", "2026-01-01T00:00:00.000")
+            await s.end()
+            return url
+
+        with caplog.at_level("DEBUG", logger="lcyt"):
+            url = _run_with_server(scenario)
+        assert f"POST {url}&seq=0" in caplog.text
+        assert "Body: b'2026-01-01T00:00:00.000\\nlogged\\n'" in caplog.text
+
+    def test_error_status_does_not_increment_sequence(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            result = await s.send("oops")
+            await s.end()
+            return result, s
+
+        result, s = _run_with_server(scenario, status=400, body="")
+        assert result.status_code == 400
+        assert s.get_sequence() == 0
+
+    def test_send_batch_drains_queue(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            s.construct("one")
+            s.construct("two")
+            result = await s.send_batch()
+            queue = s.get_queue()
+            await s.end()
+            return result, queue
+
+        result, queue = _run_with_server(scenario)
+        assert result.count == 2
+        assert queue == []
+
+    def test_unreachable_host_raises_network_error(self):
+        async def scenario():
+            s = await AsyncYoutubeLiveCaptionSender(
+                ingestion_url="http://127.0.0.1:9/closedcaption?cid=K"
+            ).start()
+            try:
+                with pytest.raises(NetworkError):
+                    await s.send("x")
+            finally:
+                await s.end()
+
+        asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# sync()
+# ---------------------------------------------------------------------------
+
+class TestSync:
+    def test_sync_sets_offset(self):
+        async def scenario(url, requests):
+            s = await AsyncYoutubeLiveCaptionSender(ingestion_url=url).start()
+            result = await s.sync()
+            await s.end()
+            return result, s
+
+        result, s = _run_with_server(scenario)
+        assert result["server_timestamp"] == SERVER_TS
+        assert isinstance(result["sync_offset"], int)
+        assert s._use_sync_offset is True
@@ -1,5 +1,6 @@
 """Tests for lcyt configuration utilities (config.py)."""
 
+import dataclasses
 import json
 import pytest
 from pathlib import Path
@@ -42,6 +43,10 @@ class TestLCYTConfig:
         assert d["cue"] == "cue3"
         assert d["sequence"] == 7
 
+    def test_to_dict_covers_every_field(self):
+        cfg = LCYTConfig(stream_key="abc", base_url="http://x.test", region="reg2", cue="cue3", sequence=7)
+        assert cfg.to_dict() == dataclasses.asdict(cfg)
+
     def test_from_dict_snake_case(self):
         cfg = LCYTConfig.from_dict({"stream_key": "k1", "base_url": "http://x.test", "sequence": 3})
         assert cfg.stream_key == "k1"
@@ -131,6 +136,17 @@ class TestLoadConfig:
         with pytest.raises(ConfigError, match="Invalid JSON"):
             load_config(path)
 
+    def test_field_errors_not_reported_as_invalid_json(self, tmp_path, monkeypatch):
+        path = tmp_path / "cfg.json"
+        path.write_text('{"sequence": "ten"}')
+
+        def reject(data):
+            raise ValueError("sequence must be an integer")
+
+        monkeypatch.setattr(LCYTConfig, "from_dict", reject)
+        with pytest.raises(ValueError, match="sequence must be an integer"):
+            load_config(path)
+
     def test_accepts_string_path(self, tmp_path):
         path = tmp_path / "cfg.json"
         path.write_text(json.dumps({"stream_key": "STRING_PATH_KEY"}))
@@ -176,6 +192,14 @@ class TestSaveConfig:
         assert loaded.region == original.region
         assert loaded.sequence == original.sequence
 
+    def test_saved_file_is_two_space_indented_utf8(self, tmp_path):
+        path = tmp_path / "pretty.json"
+        cfg = LCYTConfig(stream_key="KÄÄ", sequence=1)
+        save_config(cfg, path)
+        raw = path.read_bytes()
+        assert raw == json.dumps(cfg.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+        assert load_config(path).stream_key == "KÄÄ"
+
     def test_accepts_string_path(self, tmp_path):
         path = str(tmp_path / "str.json")
         save_config(LCYTConfig(stream_key="STR_KEY"), path)
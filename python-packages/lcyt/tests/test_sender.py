@@ -5,13 +5,22 @@ network connections are made.
 """
 
 import http.client
+import threading
 import time
+from dataclasses import asdict, astuple
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from lcyt.sender import YoutubeLiveCaptionSender, Caption, SendResult
+from lcyt.sender import (
+    YoutubeLiveCaptionSender,
+    Caption,
+    SendResult,
+    _epoch_ms_bytes,
+    _format_epoch_ms,
+    _parse_server_timestamp_ms,
+)
 from lcyt.errors import NetworkError, ValidationError
 from lcyt.config import DEFAULT_BASE_URL
 
@@ -23,17 +32,24 @@ from lcyt.config import DEFAULT_BASE_URL
 def make_mock_response(status=200, body="2026-01-01T12:00:00.000"):
     resp = MagicMock()
     resp.status = status
+    resp.will_close = False
     resp.read.return_value = body.encode("utf-8")
     return resp
 
 
 def make_mock_conn(response):
-    """Return a mock HTTPConnection that returns `response` from getresponse()."""
+    """Return a mock HTTPConnection whose socket reads back `response`."""
     conn = MagicMock()
-    conn.getresponse.return_value = response
+    conn.response_class.return_value = response
     return conn
 
 
+def sent_request(conn, index=-1):
+    """Split the raw bytes written to a mock connection into (head, body)."""
+    head, _, body = conn.sock.sendall.call_args_list[index][0][0].partition(b"\r\n\r\n")
+    return head.decode("latin-1"), body.decode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Constructor
 # ---------------------------------------------------------------------------
@@ -44,7 +60,7 @@ class TestConstructor:
         assert s._stream_key is None
         assert s._base_url == DEFAULT_BASE_URL
         assert s._sequence == 0
-        assert s._sync_offset == 0
+        assert s.get_sync_offset() == 0
         assert not s._use_sync_offset
         assert not s._started
         assert s.is_started is False
@@ -147,7 +163,7 @@ class TestSendHttp:
 
         assert isinstance(result, SendResult)
         assert result.status_code == 200
-        mock_conn.request.assert_called_once()
+        mock_conn.sock.sendall.assert_called_once()
 
     def test_send_increments_sequence_on_success(self):
         s = self._make_sender()
@@ -174,7 +190,7 @@ class TestSendHttp:
     def test_send_raises_network_error_on_exception(self):
         s = self._make_sender()
         mock_conn = MagicMock()
-        mock_conn.request.side_effect = OSError("connection refused")
+        mock_conn.sock.sendall.side_effect = OSError("connection refused")
 
         with patch("http.client.HTTPConnection", return_value=mock_conn):
             with pytest.raises(NetworkError):
@@ -183,25 +199,50 @@ class TestSendHttp:
     def test_send_passes_seq_in_url(self):
         s = self._make_sender()
         s._sequence = 7
-        captured_path = []
+        mock_conn = make_mock_conn(make_mock_response(200))
 
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("seq test")
+
+        head, _ = sent_request(mock_conn)
+        assert "seq=7 " in head.split("\r\n")[0]
+
+    def test_concurrent_sends_get_distinct_sequences(self):
+        s = self._make_sender()
         mock_resp = make_mock_response(200)
+        mock_resp.read.side_effect = lambda: time.sleep(0.02) or b""
         mock_conn = make_mock_conn(mock_resp)
-        original_request = mock_conn.request
+        barrier = threading.Barrier(4)
+        results = []
 
-        def capture_request(method, path, *a, **kw):
-            captured_path.append(path)
-
-        mock_conn.request.side_effect = capture_request
+        def worker(i):
+            barrier.wait()
+            results.append(s.send(f"c{i}").sequence)
 
         with patch("http.client.HTTPConnection", return_value=mock_conn):
-            try:
-                s.send("seq test")
-            except Exception:
-                pass  # getresponse won't be called, that's fine
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert sorted(results) == [0, 1, 2, 3]
+        seqs = [sent_request(mock_conn, i)[0].split("seq=")[1].split(" ")[0] for i in range(4)]
+        assert sorted(seqs) == ["0", "1", "2", "3"]
+        assert s.get_sequence() == 4
+
+    def test_debug_logging_includes_url_and_body(self, caplog):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn), \
+                caplog.at_level("DEBUG", logger="lcyt"):
+            s.send("logged", "2026-01-01T00:00:00.000")
 
-        if captured_path:
-            assert "seq=7" in captured_path[0]
+        assert "POST http://upload.youtube.com/closedcaption?cid=TEST_KEY&seq=0" in caplog.text
+        assert "Body: b'2026-01-01T00:00:00.000\\nlogged\\n'" in caplog.text
+        assert "Response: 200 " in caplog.text
+        assert "Sent batch #0: 1 caption(s)" in caplog.text
 
     def test_send_returns_server_timestamp(self):
         s = self._make_sender()
@@ -254,6 +295,34 @@ class TestQueue:
         q.clear()  # should not affect internal queue
         assert len(s.get_queue()) == 1
 
+    def test_max_queue_size_drops_oldest(self):
+        s = YoutubeLiveCaptionSender(stream_key="K", max_queue_size=2)
+        s.start()
+        assert s.construct("a") == 1
+        assert s.construct("b") == 2
+        assert s.construct("c") == 2
+        assert [c.text for c in s.get_queue()] == ["b", "c"]
+
+    def test_queued_text_edited_after_construct_is_sent(self):
+        s = self._started_sender()
+        s.construct("before", "2026-01-01T00:00:00.000")
+        s.get_queue()[0].text = "after"
+        assert s._build_batch_body(s._take_batch(None)) == b"2026-01-01T00:00:00.000\nafter\n"
+
+    def test_queued_caption_fields_are_text_and_timestamp(self):
+        s = self._started_sender()
+        s.construct("hello", "2026-01-01T00:00:00.000")
+        caption = s.get_queue()[0]
+        assert asdict(caption) == {"text": "hello", "timestamp": "2026-01-01T00:00:00.000"}
+        assert astuple(caption) == ("hello", "2026-01-01T00:00:00.000")
+
+    def test_encodings_released_when_batch_built(self):
+        s = self._started_sender()
+        s.construct("a")
+        s.construct("b")
+        s._build_batch_body(s._take_batch(None))
+        assert s._encoded == {}
+
     def test_clear_queue_returns_count(self):
         s = self._started_sender()
         s.construct("x")
@@ -262,6 +331,187 @@ class TestQueue:
         assert count == 2
         assert s.get_queue() == []
 
+    def test_drained_batch_not_shared_with_new_queue(self):
+        s = self._started_sender()
+        s.construct("a")
+        batch = s._take_batch(None)
+        s.construct("b")
+        assert [c.text for c in batch] == ["a"]
+        assert [c.text for c in s.get_queue()] == ["b"]
+
+
+# ---------------------------------------------------------------------------
+# construct() auto-flush (max_batch_size / max_batch_delay_ms)
+# ---------------------------------------------------------------------------
+
+class TestAutoFlush:
+    def _started_sender(self, **kwargs):
+        s = YoutubeLiveCaptionSender(stream_key="K", **kwargs)
+        s.start()
+        return s
+
+    def test_disabled_by_default(self):
+        s = self._started_sender()
+        with patch("http.client.HTTPConnection") as conn_class:
+            for i in range(50):
+                s.construct(f"c{i}")
+        conn_class.assert_not_called()
+        assert len(s.get_queue()) == 50
+
+    @staticmethod
+    def _wait_until(condition, timeout=2):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def test_flushes_at_max_batch_size(self):
+        s = self._started_sender(max_batch_size=3)
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            assert s.construct("a") == 1
+            assert s.construct("b") == 2
+            assert s.construct("c") == 3
+            assert self._wait_until(lambda: s.get_sequence() == 1)
+            s.end()
+
+        mock_conn.sock.sendall.assert_called_once()
+        assert sent_request(mock_conn)[1].count("\n") == 6
+
+    def test_flushes_when_oldest_caption_waited_max_delay(self):
+        s = self._started_sender(max_batch_delay_ms=500)
+        clock = [0]
+        s._monotonic_ms = lambda: clock[0]
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            assert s.construct("a") == 1
+            clock[0] = 200
+            assert s.construct("b") == 2
+            mock_conn.sock.sendall.assert_not_called()
+            clock[0] = 600
+            assert s.construct("c") == 3
+            assert self._wait_until(lambda: s.get_sequence() == 1)
+            s.end()
+
+        mock_conn.sock.sendall.assert_called_once()
+
+    def test_delay_restarts_with_next_batch(self):
+        s = self._started_sender(max_batch_delay_ms=500)
+        clock = [0]
+        s._monotonic_ms = lambda: clock[0]
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.construct("a")
+            clock[0] = 600
+            s.construct("b")  # a + b are due
+            assert self._wait_until(lambda: s.get_sequence() == 1)
+            clock[0] = 700
+            s.construct("c")  # opens a new batch at 700
+            clock[0] = 1100
+            assert s.construct("d") == 2
+            s.end()
+
+        mock_conn.sock.sendall.assert_called_once()
+
+    def test_delay_ignores_sync_offset_changes(self):
+        s = self._started_sender(max_batch_delay_ms=500)
+        clock = [0]
+        s._monotonic_ms = lambda: clock[0]
+
+        with patch("http.client.HTTPConnection"):
+            s.construct("a")
+            s.set_sync_offset(60_000)
+            s._use_sync_offset = True
+            assert not s._batch_due()
+            clock[0] = 500
+            assert s._batch_due()
+            s.end()
+
+    def test_flusher_deadline_survives_clock_jump(self):
+        s = self._started_sender(max_batch_delay_ms=100)
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.construct("a")
+            # Wall clock (as seen through the sync offset) steps back a minute.
+            s.set_sync_offset(-60_000)
+            s._use_sync_offset = True
+            assert self._wait_until(lambda: s.get_sequence() == 1)
+            s.end()
+
+    def test_construct_never_sends_on_caller_thread(self):
+        s = self._started_sender(max_batch_size=1)
+        senders = []
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock.sendall.side_effect = lambda *a: senders.append(threading.current_thread())
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.construct("a")
+            assert self._wait_until(lambda: s.get_sequence() == 1)
+            s.end()
+
+        assert senders and threading.current_thread() not in senders
+
+    def test_no_flusher_thread_without_limits(self):
+        s = self._started_sender()
+        assert s._flusher is None
+
+    def test_size_limit_alone_starts_flusher(self):
+        s = self._started_sender(max_batch_size=10)
+        assert s._flusher.is_alive()
+        s.end()
+
+    def test_flusher_sends_after_delay_without_further_calls(self):
+        s = self._started_sender(max_batch_delay_ms=20)
+        sent = threading.Event()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock.sendall.side_effect = lambda *a, **kw: sent.set()
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.construct("a")
+            s.construct("b")
+            assert sent.wait(2)
+            s.end()
+
+        body = sent_request(mock_conn)[1]
+        assert "\na\n" in body and "\nb\n" in body
+        assert s.get_sequence() == 1
+
+    def test_end_stops_flusher_thread(self):
+        s = self._started_sender(max_batch_delay_ms=60_000)
+        flusher = s._flusher
+        assert flusher.is_alive()
+        s.end()
+        assert not flusher.is_alive()
+        assert s._flusher is None
+
+    def test_background_failure_raised_on_next_construct(self):
+        s = self._started_sender(max_batch_delay_ms=20)
+        failed = threading.Event()
+        mock_conn = MagicMock()
+
+        def refuse(*a, **kw):
+            failed.set()
+            raise OSError("connection refused")
+
+        mock_conn.sock.sendall.side_effect = refuse
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.construct("a")
+            assert failed.wait(2)
+            for _ in range(200):
+                if s._flush_error is not None:
+                    break
+                time.sleep(0.01)
+            with pytest.raises(NetworkError):
+                s.construct("b")
+            s.end()
+
 
 # ---------------------------------------------------------------------------
 # send_batch()
@@ -323,6 +573,17 @@ class TestSendBatch:
 
         assert s._sequence == 1
 
+    def test_send_batch_spaces_auto_timestamps_100ms(self):
+        s = self._started_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn), \
+                patch("time.time_ns", return_value=1767225599_950_000_000):
+            s.send_batch([Caption("A"), Caption("B")])
+
+        body = sent_request(mock_conn)[1]
+        assert body == "2025-12-31T23:59:59.950\nA\n2026-01-01T00:00:00.050\nB\n"
+
 
 # ---------------------------------------------------------------------------
 # heartbeat()
@@ -398,7 +659,22 @@ class TestSync:
 
         assert result["server_timestamp"] is None
         # sync_offset should not change if there's no server timestamp
-        assert s._sync_offset == 0
+        assert s.get_sync_offset() == 0
+
+    def test_sync_offset_from_integer_midpoint(self):
+        s = YoutubeLiveCaptionSender(stream_key="K")
+        s.start()
+        mock_conn = make_mock_conn(make_mock_response(200, "2026-01-01T00:00:01.000"))
+        t1 = 1767225599_000_000_000
+        t2 = t1 + 40_000_000  # 40ms RTT, midpoint 23:59:59.020
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn), \
+                patch("time.time_ns", side_effect=[t1, t2]):
+            result = s.sync()
+
+        assert result["round_trip_time"] == 40
+        assert result["sync_offset"] == 1980
+        assert s.get_sync_offset() == 1980
 
 
 # ---------------------------------------------------------------------------
@@ -428,7 +704,13 @@ class TestSyncOffset:
     def test_set_sync_offset_returns_self(self):
         s = YoutubeLiveCaptionSender()
         assert s.set_sync_offset(500) is s
-        assert s._sync_offset == 500
+        assert s.get_sync_offset() == 500
+
+    def test_sync_offset_applied_to_auto_timestamps(self):
+        s = YoutubeLiveCaptionSender(stream_key="K", use_sync_offset=True)
+        s.set_sync_offset(1500)
+        with patch("time.time_ns", return_value=1767225599_000_000_000):
+            assert s._build_batch_body([Caption("A")]) == b"2026-01-01T00:00:00.500\nA\n"
 
 
 # ---------------------------------------------------------------------------
@@ -484,6 +766,71 @@ class TestFormatTimestamp:
         ts = s._format_timestamp(-2.0)  # 2 seconds ago
         assert ts.startswith("20")
 
+    def test_datetime_whole_second_has_millis(self):
+        s = self._sender()
+        ts = s._format_timestamp(datetime(2026, 3, 15, 10, 30, 0, tzinfo=timezone.utc))
+        assert ts == "2026-03-15T10:30:00.000"
+
+    def test_datetime_truncates_to_millis_and_pads_year(self):
+        s = self._sender()
+        assert s._format_timestamp(datetime(999, 1, 2, 3, 4, 5, 678999)) == "0999-01-02T03:04:05.678"
+
+    def test_iso_string_pads_short_fraction(self):
+        s = self._sender()
+        assert s._format_timestamp("2026-01-01T00:00:00.5Z") == "2026-01-01T00:00:00.500"
+
+    def test_iso_string_strips_negative_offset(self):
+        s = self._sender()
+        ts = s._format_timestamp("2026-01-01T12:00:00.250-05:00")
+        assert ts == "2026-01-01T12:00:00.250"
+
+    def test_iso_string_without_fraction_unchanged(self):
+        s = self._sender()
+        assert s._format_timestamp("2026-01-01T12:00:00") == "2026-01-01T12:00:00"
+
+    def test_epoch_seconds_matches_fromtimestamp(self):
+        s = self._sender()
+        for epoch_s in (1_700_000_000, 1_700_000_000.1234, 1_700_000_000.9996):
+            expected = datetime.fromtimestamp(epoch_s, tz=timezone.utc)
+            assert s._format_timestamp(epoch_s) == s._format_timestamp(expected)
+
+    def test_non_iso_string_falls_back(self):
+        s = self._sender()
+        assert s._format_timestamp("2026-01-01 12:00:00.123456+00:00") == "2026-01-01 12:00:00.123"
+
+
+class TestFormatEpochMs:
+    def test_matches_datetime_formatting(self):
+        s = YoutubeLiveCaptionSender(stream_key="K")
+        for epoch_ms in (1767225600123, 1767225659999, 1700000000001):
+            dt = datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+            assert _format_epoch_ms(epoch_ms) == s._format_timestamp(dt)
+
+    def test_whole_second_keeps_milliseconds(self):
+        assert _format_epoch_ms(1767225600000) == "2026-01-01T00:00:00.000"
+
+    @pytest.mark.parametrize("epoch_ms", [0, 1767225600000, 1767225600007, 1767225659999])
+    def test_bytes_variant_matches(self, epoch_ms):
+        assert _epoch_ms_bytes(epoch_ms) == _format_epoch_ms(epoch_ms).encode()
+
+
+class TestParseServerTimestamp:
+    @pytest.mark.parametrize("epoch_ms", [0, 1767225600123, 1767225659999, 1700000000001])
+    def test_round_trips_formatted_timestamps(self, epoch_ms):
+        assert _parse_server_timestamp_ms(_format_epoch_ms(epoch_ms)) == epoch_ms
+
+    def test_matches_aware_datetime_timestamp(self):
+        ts = "2026-03-15T10:30:00.250"
+        expected = datetime.fromisoformat(ts).replace(tzinfo=timezone.utc).timestamp() * 1000
+        assert _parse_server_timestamp_ms(ts) == expected
+
+    def test_offset_suffix_ignored(self):
+        assert _parse_server_timestamp_ms("1970-01-01T00:00:01.000+02:00") == 1000
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            _parse_server_timestamp_ms("not a timestamp")
+
 
 # ---------------------------------------------------------------------------
 # _build_caption_body()
@@ -500,3 +847,251 @@ class TestBuildCaptionBody:
         body = s._build_caption_body("2026-01-01T00:00:00.000", "Hello")
         assert "region:reg1#cue1" in body
         assert body.endswith("Hello")
+
+    @pytest.mark.parametrize("use_region", [False, True])
+    def test_batch_body_matches_per_caption_bodies(self, use_region):
+        s = YoutubeLiveCaptionSender(stream_key="K", use_region=use_region, region="reg2", cue="cue3")
+        captions = [
+            Caption("One", "2026-01-01T00:00:00.000"),
+            Caption("Two\nlines", "2026-01-01T00:00:01.500"),
+            Caption("Kolmé ✓", "2026-01-01T00:00:02.000"),
+        ]
+        expected = "".join(
+            s._build_caption_body(c.timestamp, c.text) + "\n" for c in captions
+        )
+        assert s._build_batch_body(captions) == expected.encode("utf-8")
+
+    @pytest.mark.parametrize("use_region", [False, True])
+    @pytest.mark.parametrize(
+        "timestamp",
+        [None, "2026-01-01T00:00:01.500Z", datetime(2026, 1, 1, tzinfo=timezone.utc), 1_767_225_600, -1.5],
+    )
+    def test_single_body_matches_batch_body(self, use_region, timestamp):
+        s = YoutubeLiveCaptionSender(stream_key="K", use_region=use_region)
+        with patch("time.time_ns", return_value=1767225599_000_000_000):
+            ts, body = s._build_single_body("Hé", timestamp)
+            assert body == s._build_batch_body([Caption("Hé", timestamp)])
+        if timestamp is None:
+            assert ts is None
+        else:
+            assert body.startswith(ts.encode())
+
+
+# ---------------------------------------------------------------------------
+# Keep-alive connection
+# ---------------------------------------------------------------------------
+
+class TestConnection:
+    def _make_sender(self, **kwargs):
+        s = YoutubeLiveCaptionSender(stream_key="K", **kwargs)
+        s.start()
+        return s
+
+    def test_reuses_connection_across_sends(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        conn_class = MagicMock(return_value=mock_conn)
+
+        with patch("http.client.HTTPConnection", conn_class):
+            s.send("A")
+            s.send("B")
+            s.heartbeat()
+
+        conn_class.assert_called_once_with("upload.youtube.com", timeout=30)
+        assert mock_conn.sock.sendall.call_count == 3
+        mock_conn.close.assert_not_called()
+
+    def test_https_url_uses_https_connection(self):
+        s = self._make_sender(base_url="https://upload.youtube.com/closedcaption")
+        conn_class = MagicMock(return_value=make_mock_conn(make_mock_response(200)))
+
+        with patch("http.client.HTTPSConnection", conn_class):
+            s.send("A")
+
+        conn_class.assert_called_once()
+
+    def test_request_path_keeps_query_and_appends_seq(self):
+        s = self._make_sender()
+        s._sequence = 4
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("A")
+
+        head, _ = sent_request(mock_conn)
+        assert head.startswith("POST /closedcaption?cid=K&seq=4 HTTP/1.1\r\n")
+
+    def test_posts_written_as_one_preframed_request(self):
+        s = self._make_sender()
+        s._sequence = 2
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send_batch([Caption("Hé", "2026-01-01T00:00:00.000")])
+            s.heartbeat()
+
+        head, body = sent_request(mock_conn, 0)
+        assert head.split("\r\n") == [
+            "POST /closedcaption?cid=K&seq=2 HTTP/1.1",
+            "Host: upload.youtube.com",
+            "Accept-Encoding: identity",
+            "Content-Type: text/plain",
+            "Content-Length: 28",
+        ]
+        assert body == "2026-01-01T00:00:00.000\nHé\n"
+        assert sent_request(mock_conn, 1) == (
+            head.replace("seq=2", "seq=3").replace("Length: 28", "Length: 0"),
+            "",
+        )
+
+    def test_opens_socket_when_connection_not_connected(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock = None
+        mock_conn.connect.side_effect = lambda: setattr(mock_conn, "sock", MagicMock())
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("A")
+
+        mock_conn.connect.assert_called_once()
+        mock_conn.sock.sendall.assert_called_once()
+
+    def test_closes_connection_when_server_will_close(self):
+        s = self._make_sender()
+        mock_resp = make_mock_response(200)
+        mock_resp.will_close = True
+        mock_conn = make_mock_conn(mock_resp)
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("A")
+
+        mock_conn.close.assert_called_once()
+
+    def test_retries_once_when_idle_connection_dropped(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock.sendall.side_effect = [None, http.client.RemoteDisconnected("closed"), None]
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("A")
+            result = s.send("B")
+
+        assert result.status_code == 200
+        assert mock_conn.sock.sendall.call_count == 3
+        assert s._sequence == 2
+
+    def test_fresh_connection_failure_not_retried(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock.sendall.side_effect = http.client.RemoteDisconnected("closed")
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            with pytest.raises(NetworkError):
+                s.send("A")
+
+        assert mock_conn.sock.sendall.call_count == 1
+        assert s._conn is None
+
+    def test_reconnect_after_server_close_not_retried(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+        mock_conn.sock = None
+        mock_conn.connect.side_effect = ConnectionResetError("refused")
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s._connection()  # connection object kept, socket closed by the server
+            with pytest.raises(NetworkError):
+                s.send("A")
+
+        mock_conn.connect.assert_called_once()
+
+    def test_close_waits_for_in_flight_request(self):
+        s = self._make_sender()
+        events = []
+        reading = threading.Event()
+        mock_resp = make_mock_response(200)
+
+        def slow_read():
+            reading.set()
+            time.sleep(0.05)
+            events.append("read")
+            return b""
+
+        mock_resp.read.side_effect = slow_read
+        mock_conn = make_mock_conn(mock_resp)
+        mock_conn.close.side_effect = lambda: events.append("close")
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            sender_thread = threading.Thread(target=s.send, args=("A",))
+            sender_thread.start()
+            assert reading.wait(2)
+            s.close()
+            sender_thread.join()
+
+        assert events == ["read", "close"]
+        assert s._sequence == 1
+
+    def test_end_closes_connection(self):
+        s = self._make_sender()
+        mock_conn = make_mock_conn(make_mock_response(200))
+
+        with patch("http.client.HTTPConnection", return_value=mock_conn):
+            s.send("A")
+        s.end()
+
+        mock_conn.close.assert_called_once()
+        assert s._conn is None
+
+
+# ---------------------------------------------------------------------------
+# use_http2 (httpx client)
+# ---------------------------------------------------------------------------
+
+class TestHttp2:
+    def _make_sender(self):
+        pytest.importorskip("h2")
+        s = YoutubeLiveCaptionSender(stream_key="K", use_http2=True)
+        s.start()
+        return s
+
+    def _mock_client(self, status=200, text="2026-01-01T12:00:00.000"):
+        client = MagicMock()
+        client.post.return_value.status_code = status
+        client.post.return_value.text = text
+        return client
+
+    def test_posts_through_one_http2_client(self):
+        s = self._make_sender()
+        client = self._mock_client()
+
+        with patch("httpx.Client", return_value=client) as client_class:
+            s.send_batch([Caption("A", "2026-01-01T00:00:00.000")])
+            result = s.heartbeat()
+
+        client_class.assert_called_once()
+        assert client_class.call_args.kwargs["http2"] is True
+        first, second = client.post.call_args_list
+        assert first.args == ("http://upload.youtube.com/closedcaption?cid=K&seq=0",)
+        assert first.kwargs["content"] == b"2026-01-01T00:00:00.000\nA\n"
+        assert second.args == ("http://upload.youtube.com/closedcaption?cid=K&seq=1",)
+        assert result.server_timestamp == "2026-01-01T12:00:00.000"
+
+    def test_failure_raises_network_error_and_keeps_client(self):
+        s = self._make_sender()
+        client = self._mock_client()
+        client.post.side_effect = [OSError("connection refused"), client.post.return_value]
+
+        with patch("httpx.Client", return_value=client) as client_class:
+            with pytest.raises(NetworkError):
+                s.send("A")
+            assert s.send("B").sequence == 0
+
+        client.close.assert_not_called()
+        client_class.assert_called_once()
+
+    def test_start_requires_httpx(self):
+        s = YoutubeLiveCaptionSender(stream_key="K", use_http2=True)
+        with patch.dict("sys.modules", {"httpx": None}):
+            with pytest.raises(ImportError, match="lcyt\\[http2\\]"):
+                s.start()
+        assert not s.is_started